@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+# Numba-compiled mask kernels (see expr._match_hot / expr._match_fused).
+# Imported lazily by expr.eval_expr: importing numba costs ~0.2 s, so callers that
+# never hit a kernel never pay for it. Requires numba (pip install numba).
+
+import functools
+
+import numba
+import numpy as np
+
+# comparison codes shared with expr._HOT_OPS
+LE, LT, GE, GT = 0, 1, 2, 3
+
+
+@numba.njit(parallel=True, cache=True)
+def abs_diff_cmp(a, b, thr, op):
+    # mask[i] = abs(a[i] - b[i]) <op> thr in one fused pass (no diff / abs temporaries).
+    # No fastmath: NaN must compare False exactly like NumPy.
+    n = a.shape[0]
+    out = np.empty(n, dtype=np.bool_)
+    for i in numba.prange(n):
+        d = abs(a[i] - b[i])
+        if op == LE:
+            out[i] = d <= thr
+        elif op == LT:
+            out[i] = d < thr
+        elif op == GE:
+            out[i] = d >= thr
+        else:
+            out[i] = d > thr
+    return out
+
+
+_FUSED_SRC = """
+def fused({args}):
+    n = _c0.shape[0]
+    out = np.empty(n, dtype=np.bool_)
+    for i in numba.prange(n):
+        out[i] = {body}
+    return out
+"""
+
+
+@functools.lru_cache(maxsize=64)
+def fused_mask(body: str, n_cols: int):
+    # JIT a one-pass mask loop for a scalar body built by expr._match_fused over the
+    # arguments _c0.._c{n_cols-1}. The body comes from a validated expression AST.
+    # error_model="numpy": x / 0 gives inf/nan instead of raising, like NumPy.
+    src = _FUSED_SRC.format(args=", ".join(f"_c{k}" for k in range(n_cols)), body=body)
+    ns = {"np": np, "numba": numba}
+    exec(compile(src, "<atl08kit fused kernel>", "exec"), ns)
+    return numba.njit(parallel=True, error_model="numpy")(ns["fused"])
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, Mapping, Sequence
 
@@ -10,10 +11,29 @@ import pandas as pd
 
 from atl08kit.beams import get_strong_beams_from_h5
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except Exception:  # pragma: no cover
+    pa = None  # type: ignore
+    pq = None  # type: ignore
+
 
 # Supported ATL08 beam identifiers (no leading "/").
 _ALL_BEAMS = ["gt1l", "gt1r", "gt2l", "gt2r", "gt3l", "gt3r"]
+_ALL_BEAMS_SET = frozenset(_ALL_BEAMS)
+_BEAM_INDEX = {b: i for i, b in enumerate(_ALL_BEAMS)}  # beam -> categorical code
+
+# Fixed categories keep the beam column 1 byte/row and dtype-stable across beams.
+_BEAM_DTYPE = pd.CategoricalDtype(_ALL_BEAMS)
+
 
+# HDF5 open tuning: a 64 MiB raw-data chunk cache (default is 1 MiB, which thrashes
+# on chunked land_segments fields) and a page buffer for paged-allocation files.
+_RDCC_NBYTES = 64 * 1024 * 1024
+_RDCC_NSLOTS = 100003
+_RDCC_W0 = 0.75
+_PAGE_BUF_SIZE = 16 * 1024 * 1024
 
 @dataclass(frozen=True)
 class ReadSummary:
@@ -37,6 +57,8 @@ _DEFAULT_FIELDS: dict[str, str] = {
     "terrain_slope": "terrain/terrain_slope",
     "n_te_photons": "terrain/n_te_photons",
 }
+# dataset path -> default column name, built once at import
+_DEFAULT_FIELDS_INV: dict[str, str] = {v: k for k, v in _DEFAULT_FIELDS.items()}
 
 
 def _normalize_beams(beams: Sequence[str] | None) -> list[str]:
@@ -49,24 +71,94 @@ def _normalize_beams(beams: Sequence[str] | None) -> list[str]:
             continue
         if b.startswith("/"):
             b = b[1:]
-        if b not in _ALL_BEAMS:
+        if b not in _ALL_BEAMS_SET:
             raise ValueError(f"Unknown beam name: {b}. Expected one of: {_ALL_BEAMS}")
         out.append(b)
     return out
 
 
-def _resolve_fields(fields: Sequence[str] | None) -> dict[str, str]:
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise ImportError(
+            "pyarrow is required for Parquet output. Install it first, e.g.\n"
+            "  conda install -c conda-forge pyarrow\n"
+            "or\n"
+            "  pip install pyarrow"
+        )
+
+
+def _open_h5(h5_path: Path) -> h5py.File:
+    # Open read-only with a larger chunk cache / page buffer.
+    kw = dict(rdcc_nbytes=_RDCC_NBYTES, rdcc_nslots=_RDCC_NSLOTS, rdcc_w0=_RDCC_W0)
+    try:
+        return h5py.File(h5_path, "r", page_buf_size=_PAGE_BUF_SIZE, **kw)
+    except (OSError, TypeError, ValueError):
+        # page buffer rejected (e.g. file page size > buffer, or old h5py/HDF5)
+        return h5py.File(h5_path, "r", **kw)
+
+
+def _constant_categorical(value: str, n: int) -> pd.Categorical:
+    # Length-n single-category column (e.g. source_file), stored as int8 codes.
+    return pd.Categorical.from_codes(np.zeros(n, dtype=np.int8), dtype=pd.CategoricalDtype([value]))
+
+
+def _memmap_offset(dset: h5py.Dataset) -> int | None:
+    # File offset if the raw bytes can be mapped directly: contiguous (no chunks,
+    # hence no filters), allocated, plain file driver, not virtual/external.
+    if dset.chunks is not None or dset.dtype.kind == "O" or dset.size == 0:
+        return None
+    if dset.file.driver != "sec2" or dset.is_virtual or dset.external is not None:
+        return None
+    return dset.id.get_offset()
+
+
+def _read_dataset(dset: h5py.Dataset) -> np.ndarray:
+    # Read a whole dataset into a preallocated buffer (skips h5py's slicing copy).
+    # Variable-length (object) datasets cannot be read in place -> plain read.
+    if dset.dtype.kind == "O":
+        return dset[()]
+
+    off = _memmap_offset(dset)
+    if off is not None:
+        # Contiguous: copy straight out of the page cache, bypassing HDF5.
+        # The copy means no mapping outlives the open H5 file.
+        mm = np.memmap(dset.file.filename, dtype=dset.dtype, mode="r", offset=off, shape=dset.shape)
+        return np.array(mm)
+
+    buf = np.empty(dset.shape, dtype=dset.dtype)
+    if buf.size:
+        dset.read_direct(buf)
+    return buf
+
+
+def _storage_offset(dset: h5py.Dataset) -> int:
+    # File offset of the dataset's first byte (contiguous) or first chunk (chunked).
+    # Compact / unallocated / unknown layouts sort first.
+    off = dset.id.get_offset()
+    if off is not None:
+        return int(off)
+    if dset.chunks is not None:
+        try:
+            return int(dset.id.get_chunk_info(0).byte_offset or 0)
+        except Exception:
+            pass
+    return 0
+
+
+def _resolve_fields(fields: Sequence[str]) -> dict[str, str]:
     """
     Normalize user field selection to a mapping of output column name -> land_segments dataset path.
     """
-    if fields is None:
-        return dict(_DEFAULT_FIELDS)
+    return dict(_resolve_fields_cached(tuple(str(x) for x in fields)))
 
+
+@lru_cache(maxsize=64)
+def _resolve_fields_cached(fields: tuple[str, ...]) -> tuple[tuple[str, str], ...]:
+    # Batch extraction repeats the same selection for every file -> resolve once.
     mapping: dict[str, str] = {}
-    inv = {v: k for k, v in _DEFAULT_FIELDS.items()}
 
     for item in fields:
-        item = str(item).strip()
+        item = item.strip()
         if not item:
             continue
 
@@ -76,8 +168,8 @@ def _resolve_fields(fields: Sequence[str] | None) -> dict[str, str]:
             continue
 
         # default dataset path
-        if item in inv:
-            mapping[inv[item]] = item
+        if item in _DEFAULT_FIELDS_INV:
+            mapping[_DEFAULT_FIELDS_INV[item]] = item
             continue
 
         # raw dataset path
@@ -86,7 +178,118 @@ def _resolve_fields(fields: Sequence[str] | None) -> dict[str, str]:
 
     if not mapping:
         raise ValueError("fields resolved to empty selection")
-    return mapping
+    return tuple(mapping.items())
+
+
+def _read_beam(
+    f: h5py.File,
+    beam: str,
+    field_map: Mapping[str, str] | None,
+) -> tuple[dict[str, np.ndarray | pd.Categorical] | None, set[str], set[str]]:
+    # Read one /{beam}/land_segments group -> (columns or None, used, skipped).
+    # - field_map set: strict extraction (missing/misaligned -> error)
+    # - field_map None: auto-scan aligned 1D datasets (others skipped)
+    used_set: set[str] = set()
+    skipped_set: set[str] = set()
+
+    ls = f"/{beam}/land_segments"
+    if ls not in f:
+        return None, used_set, skipped_set
+    grp = f[ls]
+
+    lat = _read_dataset(grp["latitude"])
+    lon = _read_dataset(grp["longitude"])
+    n = int(len(lat))
+    if n == 0:
+        return None, used_set, skipped_set
+
+    data: dict[str, np.ndarray | pd.Categorical] = {
+        "lon": lon,
+        "lat": lat,
+        "beam": pd.Categorical.from_codes(np.full(n, _BEAM_INDEX[beam], dtype=np.int8), dtype=_BEAM_DTYPE),
+    }
+
+    # Select fields to extract (strict vs auto)
+    if field_map is not None:
+        dsets: list[tuple[str, str, h5py.Dataset]] = []
+        for out_col, rel_path in field_map.items():
+            dset = grp.get(rel_path)
+            if not isinstance(dset, h5py.Dataset):
+                raise KeyError(f"Dataset missing in {ls}: '{rel_path}'")
+
+            # shape checks use metadata only (no data read)
+            if dset.ndim != 1:
+                raise ValueError(
+                    f"Field '{rel_path}' is not 1D (ndim={dset.ndim}). "
+                    "Cannot store it in a point table CSV without expansion."
+                )
+            if dset.shape[0] != n:
+                raise ValueError(
+                    f"Field '{rel_path}' length mismatch: len(field)={dset.shape[0]} vs len(lat)={n}."
+                )
+
+            dsets.append((out_col, rel_path, dset))
+
+        # read in on-disk order (sequential I/O), keep field order for columns
+        arrays: dict[str, np.ndarray] = {}
+        for out_col, rel_path, dset in sorted(dsets, key=lambda x: _storage_offset(x[2])):
+            arrays[out_col] = _read_dataset(dset)
+            used_set.add(rel_path)
+        for out_col, _, _ in dsets:
+            data[out_col] = arrays[out_col]
+
+    else:
+        # Auto: keep aligned 1D datasets under land_segments
+        # (visititems traverses in C, pre-order by name like a recursive walk)
+        found: list[tuple[str, h5py.Dataset]] = []
+        grp.visititems(lambda p, obj: found.append((p, obj)) if isinstance(obj, h5py.Dataset) else None)
+
+        for p, obj in found:
+            if obj.ndim != 1 or obj.shape[0] != n:
+                skipped_set.add(p)
+                continue
+            try:
+                arr = _read_dataset(obj)
+            except Exception:
+                skipped_set.add(p)
+                continue
+
+            col = p.replace("/", "_")
+            if col in data:
+                col = f"ls_{col}"
+            data[col] = arr
+            used_set.add(p)
+
+    return data, used_set, skipped_set
+
+
+def _join_columns(
+    parts: Sequence[Mapping[str, np.ndarray | pd.Categorical]],
+) -> dict[str, np.ndarray | pd.Categorical | pd.Series]:
+    # Stack per-beam column dicts into one column dict (one allocation per column).
+    # Columns missing from some beams (auto-scan) are NaN-filled like pd.concat.
+    if len(parts) == 1:
+        # single beam (e.g. one --beams value / strong_only on one track): nothing to stack
+        return dict(parts[0])
+
+    names: dict[str, None] = {}
+    for data in parts:
+        names.update(dict.fromkeys(data))
+
+    cols: dict[str, np.ndarray | pd.Categorical | pd.Series] = {}
+    for name in names:
+        arrs = [data.get(name) for data in parts]
+        if any(a is None for a in arrs):
+            cols[name] = pd.concat(
+                [pd.Series(a) if a is not None else pd.Series(np.nan, index=range(len(d["lat"])))
+                 for a, d in zip(arrs, parts)],
+                ignore_index=True,
+            )
+        elif isinstance(arrs[0], pd.Categorical):
+            cols[name] = pd.Categorical.from_codes(np.concatenate([a.codes for a in arrs]), dtype=arrs[0].dtype)
+        else:
+            cols[name] = np.concatenate(arrs)
+    return cols
 
 
 def read_atl08_h5(
@@ -97,103 +300,57 @@ def read_atl08_h5(
     fields: Sequence[str] | None = None,
     add_source_file: bool = True,
     source_col: str = "source_file",
+    dtype_backend: str = "numpy",
 ) -> tuple[pd.DataFrame, ReadSummary]:
     # Build a flat point table from /{beam}/land_segments.
     # - fields set: strict extraction (missing/misaligned -> error)
     # - fields None: auto-scan aligned 1D datasets (others skipped)
+    # - dtype_backend="pyarrow": Arrow-backed columns (pd.ArrowDtype), requires pyarrow
     h5_path = Path(h5_path)
     if not h5_path.exists():
         raise FileNotFoundError(f"H5 not found: {h5_path}")
 
+    if dtype_backend not in ("numpy", "pyarrow"):
+        raise ValueError("dtype_backend must be 'numpy' or 'pyarrow'")
+    if dtype_backend == "pyarrow":
+        _require_pyarrow()
+
     selected_beams = _normalize_beams(beams)
 
     if strong_only:
         strong = set(get_strong_beams_from_h5(h5_path))
         selected_beams = [b for b in selected_beams if b in strong]
 
-    frames: list[pd.DataFrame] = []
+    field_map = _resolve_fields(fields) if fields is not None else None
+
+    parts: list[dict[str, np.ndarray | pd.Categorical]] = []
     N_total = 0
 
     # debug info
     used_set: set[str] = set()
     skipped_set: set[str] = set()
 
-    with h5py.File(h5_path, "r") as f:
-        for beam in selected_beams:
-            ls = f"/{beam}/land_segments"
-            if ls not in f:
-                continue
-            grp = f[ls]
-
-            lat = grp["latitude"][:]
-            lon = grp["longitude"][:]
-            n = int(len(lat))
-            if n == 0:
-                continue
-            N_total += n
+    with _open_h5(h5_path) as f:
+        # serial: h5py serializes every HDF5 call behind one lock, threads gain nothing
+        results = [_read_beam(f, b, field_map) for b in selected_beams]
 
-            data: dict[str, np.ndarray] = {
-                "lon": lon,
-                "lat": lat,
-                "beam": np.full(n, beam, dtype=object),
-            }
-
-            # Select fields to extract (strict vs auto)
-            if fields is not None:
-                field_map = _resolve_fields(fields)
-
-                for out_col, rel_path in field_map.items():
-                    if rel_path not in grp:
-                        raise KeyError(f"Dataset missing in {ls}: '{rel_path}'")
-
-                    arr = grp[rel_path][:]
-
-                    if getattr(arr, "ndim", 0) != 1:
-                        raise ValueError(
-                            f"Field '{rel_path}' is not 1D (ndim={arr.ndim}). "
-                            "Cannot store it in a point table CSV without expansion."
-                        )
-                    if len(arr) != n:
-                        raise ValueError(
-                            f"Field '{rel_path}' length mismatch: len(field)={len(arr)} vs len(lat)={n}."
-                        )
-
-                    data[out_col] = arr
-                    used_set.add(rel_path)
-
-            else:
-                # Auto: keep aligned 1D datasets under land_segments
-                def walk(g, prefix: str = "") -> None:
-                    for k, obj in g.items():
-                        p = k if prefix == "" else f"{prefix}/{k}"
-                        if isinstance(obj, h5py.Dataset):
-                            try:
-                                arr = obj[:]
-                            except Exception:
-                                skipped_set.add(p)
-                                continue
-
-                            if getattr(arr, "ndim", 0) != 1 or len(arr) != n:
-                                skipped_set.add(p)
-                                continue
-                            col = p.replace("/", "_")
-                            if col in data:
-                                col = f"ls_{col}"
-                            data[col] = arr
-                            used_set.add(p)
-                        else:
-                            walk(obj, p)
-
-                walk(grp, "")
-
-            df = pd.DataFrame(data)
+    for data, used, skipped in results:
+        used_set |= used
+        skipped_set |= skipped
+        if data is None:
+            continue
+        N_total += len(data["lat"])
+        parts.append(data)
 
-            if add_source_file:
-                df[source_col] = h5_path.stem
+    # One DataFrame from pre-joined columns (no per-beam frames + pd.concat)
+    out = pd.DataFrame(_join_columns(parts), copy=False) if parts else pd.DataFrame()
 
-            frames.append(df)
+    if add_source_file and parts:
+        out[source_col] = _constant_categorical(h5_path.stem, len(out))
 
-    out = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    if dtype_backend == "pyarrow":
+        # numeric columns convert zero-copy; categoricals become Arrow dictionaries
+        out = pa.Table.from_pandas(out, preserve_index=False).to_pandas(types_mapper=pd.ArrowDtype)
 
     N_out = int(len(out))
     pass_rate = (N_out / N_total) if N_total else 0.0
@@ -214,23 +371,107 @@ def list_land_segment_fields(h5_path: str | Path, *, beam: str = "gt2l") -> list
     if not h5_path.exists():
         raise FileNotFoundError(f"H5 not found: {h5_path}")
 
-    beam = beam.lstrip("/")
+    # (mtime, size) in the cache key -> a rewritten file is re-scanned
+    st = h5_path.stat()
+    return list(_list_fields_cached(str(h5_path.resolve()), st.st_mtime_ns, st.st_size, beam.lstrip("/")))
+
+
+@lru_cache(maxsize=256)
+def _list_fields_cached(path: str, mtime_ns: int, size: int, beam: str) -> tuple[str, ...]:
     base = f"/{beam}/land_segments"
 
     out: list[str] = []
-    with h5py.File(h5_path, "r") as f:
+    with _open_h5(Path(path)) as f:
         if base not in f:
             raise KeyError(f"Missing group: {base}")
         grp = f[base]
 
-        def walk(g, prefix: str = "") -> None:
-            for k, obj in g.items():
-                p = k if prefix == "" else f"{prefix}/{k}"
-                if isinstance(obj, h5py.Dataset):
-                    out.append(p)
-                else:
-                    walk(obj, p)
+        grp.visititems(lambda p, obj: out.append(p) if isinstance(obj, h5py.Dataset) else None)
+
+    return tuple(sorted(out))
 
-        walk(grp, "")
 
-    return sorted(out)
\ No newline at end of file
+def write_atl08_parquet(
+    h5_path: str | Path,
+    out_path: str | Path,
+    *,
+    beams: Sequence[str] | None = None,
+    strong_only: bool = False,
+    fields: Sequence[str] | None = None,
+    add_source_file: bool = True,
+    source_col: str = "source_file",
+) -> ReadSummary:
+    # Same table as read_atl08_h5, streamed to Parquet one beam at a time
+    # (peak memory = one beam instead of the whole granule).
+    # The first beam fixes the schema; later beams are cast to it and
+    # columns they lack are written as nulls.
+    _require_pyarrow()
+
+    h5_path = Path(h5_path)
+    if not h5_path.exists():
+        raise FileNotFoundError(f"H5 not found: {h5_path}")
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+
+    selected_beams = _normalize_beams(beams)
+
+    if strong_only:
+        strong = set(get_strong_beams_from_h5(h5_path))
+        selected_beams = [b for b in selected_beams if b in strong]
+
+    field_map = _resolve_fields(fields) if fields is not None else None
+
+    N_total = 0
+    used_set: set[str] = set()
+    skipped_set: set[str] = set()
+
+    writer = None
+    try:
+        with _open_h5(h5_path) as f:
+            for beam in selected_beams:
+                data, used, skipped = _read_beam(f, beam, field_map)
+                used_set |= used
+                skipped_set |= skipped
+                if data is None:
+                    continue
+                n = len(data["lat"])
+                N_total += n
+
+                df = pd.DataFrame(data, copy=False)
+                if add_source_file:
+                    df[source_col] = _constant_categorical(h5_path.stem, n)
+                table = pa.Table.from_pandas(df, preserve_index=False)
+
+                if writer is None:
+                    writer = pq.ParquetWriter(out_path, table.schema)
+                else:
+                    extra = [c for c in table.column_names if c not in writer.schema.names]
+                    if extra:
+                        raise ValueError(
+                            f"Beam '{beam}' has fields not present in earlier beams: {extra}. "
+                            "Pass fields=... to stream a fixed schema."
+                        )
+                    table = pa.Table.from_arrays(
+                        [
+                            table[fld.name].cast(fld.type) if fld.name in table.column_names else pa.nulls(n, fld.type)
+                            for fld in writer.schema
+                        ],
+                        schema=writer.schema,
+                    )
+                writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    if writer is None:
+        # no beam had data: still leave a (column-less) Parquet file behind
+        pq.write_table(pa.table({}), out_path)
+
+    return ReadSummary(
+        N_total=N_total,
+        N_out=N_total,
+        pass_rate=1.0 if N_total else 0.0,
+        beams_used=selected_beams,
+        fields_used=sorted(used_set),
+        fields_skipped=sorted(skipped_set),
+    )
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, asdict
+from functools import partial
 from pathlib import Path
-from typing import Optional, Sequence
+from typing import Optional, Sequence, Union
 
 import pandas as pd
 
-from atl08kit.io import read_table, write_table
+from atl08kit.io import list_files, read_table, write_table
+from atl08kit.expr import CompiledExpr, compile_expr
 from atl08kit.filters import filter_by_expr
 from atl08kit.beams import build_strong_beam_map, filter_strong_beams
 from atl08kit.raster import filter_by_raster
@@ -69,7 +73,7 @@ def batch_process_one(
     in_csv: Path,
     out_dir: Path,
     *,
-    expr: Optional[str] = None,
+    expr: Optional[Union[str, CompiledExpr]] = None,
     # vector
     vector_mask: Optional[str] = None,
     vector_mode: str = "clip",
@@ -93,8 +97,12 @@ def batch_process_one(
     use_strong_beams: bool = False,
     # export
     export_ext: Optional[str] = None,
+    # table output format (".csv" / ".parquet" / ".feather"); None = same as input
+    out_format: Optional[str] = None,
+    # narrow int dtypes + categorical text columns on read (io._auto_downcast)
+    compact_dtypes: bool = False,
 ) -> BatchRow:
-    df = read_table(in_csv)
+    df = read_table(in_csv, downcast=compact_dtypes)
     N0 = len(df)
     row = BatchRow(file=in_csv.name, N_in=N0, N_out=N0, pass_rate=1.0)
 
@@ -170,9 +178,11 @@ def batch_process_one(
         df, s = filter_by_expr(df, expr)
         row.expr_pass_rate = float(s["pass_rate"])
 
-    # --- write output csv ---
+    # --- write output table ---
     out_dir.mkdir(parents=True, exist_ok=True)
     out_csv = out_dir / in_csv.name
+    if out_format:
+        out_csv = out_csv.with_suffix(out_format)
     write_table(df, out_csv)
     row.out_csv = str(out_csv)
 
@@ -189,12 +199,26 @@ def batch_process_one(
     return row
 
 
+# Per-process worker: the configured batch_process_one partial (strong_map, expr, ...)
+# is shipped once per process by the pool initializer, not pickled with every file.
+_WORKER = None
+
+
+def _init_worker(process_one) -> None:
+    global _WORKER
+    _WORKER = process_one
+
+
+def _run_worker(in_csv: Path) -> BatchRow:
+    return _WORKER(in_csv)
+
+
 def batch_run(
     in_dir: Path,
     out_dir: Path,
     *,
     pattern: str = "*.csv",
-    expr: Optional[str] = None,
+    expr: Optional[Union[str, CompiledExpr]] = None,
     # vector
     vector_mask: Optional[str] = None,
     vector_mode: str = "clip",
@@ -215,48 +239,73 @@ def batch_run(
     raster_keep_nodata: bool = False,
     # beams
     h5_folder: Optional[Path] = None,
+    strong_map: Optional[dict] = None,
     strong_beams: bool = False,
     # export
     export_ext: Optional[str] = None,
+    out_format: Optional[str] = None,
+    compact_dtypes: bool = False,
     summary_csv: Optional[Path] = None,
+    # parallelism (0 = all cores)
+    jobs: int = 1,
 ) -> pd.DataFrame:
     in_dir = Path(in_dir)
     out_dir = Path(out_dir)
-    files = sorted(in_dir.glob(pattern))
+    files = list_files(in_dir, pattern)
+
+    if jobs < 0:
+        raise ValueError("jobs must be >= 0")
 
-    strong_map = None
-    if strong_beams:
+    # parse + validate once for the whole batch (bad expressions fail before any file)
+    if isinstance(expr, str) and expr:
+        expr = compile_expr(expr)
+
+    # A prebuilt strong_map skips the H5 folder scan; otherwise build it once here.
+    if not strong_beams:
+        strong_map = None
+    elif strong_map is None:
         if h5_folder is None:
-            raise ValueError("h5_folder is required when strong_beams=True")
+            raise ValueError("h5_folder or strong_map is required when strong_beams=True")
         strong_map = build_strong_beam_map(h5_folder)
 
-    rows: list[BatchRow] = []
-    for f in files:
-        r = batch_process_one(
-            f,
-            out_dir,
-            expr=expr,
-            vector_mask=vector_mask,
-            vector_mode=vector_mode,
-            vector_lon=vector_lon,
-            vector_lat=vector_lat,
-            vector_crs=vector_crs,
-            vector_predicate=vector_predicate,
-            vector_monthly_folder=vector_monthly_folder,
-            vector_source_file=vector_source_file,
-            vector_ext=vector_ext,
-            raster_mask=raster_mask,
-            raster_keep=raster_keep,
-            raster_drop=raster_drop,
-            raster_lon=raster_lon,
-            raster_lat=raster_lat,
-            raster_band=raster_band,
-            raster_keep_nodata=raster_keep_nodata,
-            strong_map=strong_map,
-            use_strong_beams=strong_beams,
-            export_ext=export_ext,
-        )
-        rows.append(r)
+    process_one = partial(
+        batch_process_one,
+        out_dir=out_dir,
+        expr=expr,
+        vector_mask=vector_mask,
+        vector_mode=vector_mode,
+        vector_lon=vector_lon,
+        vector_lat=vector_lat,
+        vector_crs=vector_crs,
+        vector_predicate=vector_predicate,
+        vector_monthly_folder=vector_monthly_folder,
+        vector_source_file=vector_source_file,
+        vector_ext=vector_ext,
+        raster_mask=raster_mask,
+        raster_keep=raster_keep,
+        raster_drop=raster_drop,
+        raster_lon=raster_lon,
+        raster_lat=raster_lat,
+        raster_band=raster_band,
+        raster_keep_nodata=raster_keep_nodata,
+        strong_map=strong_map,
+        use_strong_beams=strong_beams,
+        export_ext=export_ext,
+        out_format=out_format,
+        compact_dtypes=compact_dtypes,
+    )
+
+    # Files are independent: fan out to worker processes (rows keep file order)
+    workers = (os.cpu_count() or 1) if jobs == 0 else jobs
+    workers = min(workers, len(files))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(process_one,)) as ex:
+            # hand files out in chunks (~4 per worker): one IPC round-trip per chunk
+            # instead of per file on batches of many small CSVs
+            chunksize = max(1, len(files) // (workers * 4))
+            rows: list[BatchRow] = list(ex.map(_run_worker, files, chunksize=chunksize))
+    else:
+        rows = [process_one(f) for f in files]
 
     df_sum = pd.DataFrame([asdict(x) for x in rows])
     if summary_csv:
@@ -2,9 +2,12 @@ from __future__ import annotations
 
 from pathlib import Path
 import h5py
-from typing import Dict, List, Tuple, Any
+import numpy as np
+from typing import Callable, Dict, List, Tuple, Any
 import pandas as pd
 
+from atl08kit.io import list_files
+
 
 def get_strong_beams(sc_orient: int) -> List[str]:
     # Strong beams depend on /orbit_info/sc_orient (0: left, 1: right).
@@ -25,31 +28,22 @@ def get_strong_beams_from_h5(h5_path: str | Path) -> List[str]:
 
 def build_strong_beam_map(folder: str | Path) -> Dict[str, List[str]]:
     # Map ATL08 filename stem -> strong beam ids.
+    # Serial on purpose: h5py holds one global lock per call, so threads only add overhead.
     folder = Path(folder)
-    strong_map: Dict[str, List[str]] = {}
-
-    for p in sorted(folder.glob("ATL08_*.h5")):
-        strong_map[p.stem] = get_strong_beams_from_h5(p)
+    return {p.stem: get_strong_beams_from_h5(p) for p in list_files(folder, "ATL08_*.h5")}
 
-    return strong_map
 
 def norm_src_name(src: str) -> str:
-    # Normalize source_file values to match ATL08 H5 stems.
+    # Normalize source_file values to match ATL08 H5 stems: drop the CSV-stage
+    # suffixes ("_Rule1_full".."_Rule8_full", "_raw_allpoints"), stacked ones included.
     base = Path(str(src)).stem  # drop .csv if any
-    for suffix in [
-        "_Rule8_full",
-        "_Rule7_full",
-        "_Rule6_full",
-        "_Rule5_full",
-        "_Rule4_full",
-        "_Rule3_full",
-        "_Rule2_full",
-        "_Rule1_full",
-        "_raw_allpoints",
-    ]:
-        if base.endswith(suffix):
-            base = base[: -len(suffix)]
-    return base
+    while True:
+        if base.endswith("_full") and base[-11:-6] == "_Rule" and base[-6] in "12345678":
+            base = base[:-11]
+        elif base.endswith("_raw_allpoints"):
+            base = base[:-14]
+        else:
+            return base
 
 
 def filter_strong_beams(
@@ -58,10 +52,12 @@ def filter_strong_beams(
     *,
     beam_col: str = "beam",
     source_col: str = "source_file",
+    normalize: Callable[[str], str] = norm_src_name,
 ) -> Tuple[pd.DataFrame, Dict[str, Any]]:
     # Keep only rows whose beam is strong for the corresponding ATL08 file.
-    need = {beam_col, source_col}
-    missing = need - set(df.columns)
+    # normalize maps a source_file value to a strong_map key (once per unique value).
+    # probe the column Index's hash table; no set() of every column name
+    missing = [c for c in {beam_col, source_col} if c not in df.columns]
     if missing:
         raise ValueError(f"Strong-beam filtering requires columns: {sorted(missing)}")
 
@@ -69,13 +65,18 @@ def filter_strong_beams(
         summary = {"N_total": 0, "N_pass": 0, "pass_rate": 0.0}
         return df.copy(), summary
 
-    def is_strong_row(row) -> bool:
-        key = norm_src_name(row[source_col])
-        beam = str(row[beam_col])
-        return beam in strong_map.get(key, [])
-
-    mask = df.apply(is_strong_row, axis=1)
-    out = df.loc[mask].copy()
+    # Sources/beams have tiny cardinality: decide once per (unique source, unique beam)
+    # and gather the per-row answer from that table with the factorized codes.
+    # The table is a dense, collision-free bitset over (source code, beam code);
+    # per row this is one integer gather, no string hashing.
+    src_codes, src_uniques = pd.factorize(df[source_col], use_na_sentinel=False)
+    beam_codes, beam_uniques = pd.factorize(df[beam_col], use_na_sentinel=False)
+    beam_names = [str(b) for b in beam_uniques]
+    allowed = [set(strong_map.get(normalize(s), ())) for s in src_uniques]
+    table = np.array([[b in a for b in beam_names] for a in allowed], dtype=bool)
+    mask = table.ravel()[src_codes * len(beam_names) + beam_codes]
+    # positional gather, as in filter_by_expr
+    out = df.take(np.flatnonzero(mask))
 
     total = int(len(df))
     kept = int(mask.sum())
@@ -1,21 +1,13 @@
 from __future__ import annotations
 
 import argparse
+from functools import lru_cache
 from pathlib import Path
 import re
 import sys
 
-from atl08kit.expr import ExprError
-from atl08kit.filters import filter_by_expr
-from atl08kit.beams import build_strong_beam_map
-from atl08kit.pipeline import run_pipeline
-from atl08kit.io import read_table, write_table
-from atl08kit.export import export_points
-from atl08kit.raster import filter_by_raster
-from atl08kit.vector_mask import clip_points, exclude_points
-from atl08kit.water import extract_yyyymm_from_atl08_name
-from atl08kit.batch import batch_run
-from atl08kit.atl08 import list_land_segment_fields, read_atl08_h5
+# Command modules are imported inside each cmd_* so that e.g. `version` or `filter`
+# never pay for h5py / rasterio / geopandas at startup.
 
 
 _ATL08_RE = re.compile(r"(ATL08_\d{14}_\d+_\d+_\d+)", re.IGNORECASE)
@@ -27,6 +19,8 @@ def cmd_version(_: argparse.Namespace) -> int:
 
 
 def cmd_fields(args: argparse.Namespace) -> int:
+    from atl08kit.atl08 import list_land_segment_fields
+
     try:
         fields = list_land_segment_fields(args.h5, beam=args.beam)
     except Exception as e:
@@ -39,16 +33,31 @@ def cmd_fields(args: argparse.Namespace) -> int:
 
 
 def cmd_extract(args: argparse.Namespace) -> int:
+    from atl08kit.atl08 import read_atl08_h5, write_atl08_parquet
+    from atl08kit.io import write_table
+
     try:
-        df, s = read_atl08_h5(
-            args.h5,
-            beams=args.beams,
-            strong_only=args.strong_only,
-            fields=args.fields,
-            add_source_file=True,
-            source_col="source_file",
-        )
-        write_table(df, args.output)
+        if Path(args.output).suffix.lower() == ".parquet":
+            # stream beam-by-beam instead of materializing the whole table
+            s = write_atl08_parquet(
+                args.h5,
+                args.output,
+                beams=args.beams,
+                strong_only=args.strong_only,
+                fields=args.fields,
+                add_source_file=True,
+                source_col="source_file",
+            )
+        else:
+            df, s = read_atl08_h5(
+                args.h5,
+                beams=args.beams,
+                strong_only=args.strong_only,
+                fields=args.fields,
+                add_source_file=True,
+                source_col="source_file",
+            )
+            write_table(df, args.output)
     except Exception as e:
         print(f"[atl08kit] extract error: {e}", file=sys.stderr)
         return 2
@@ -62,10 +71,24 @@ def cmd_extract(args: argparse.Namespace) -> int:
 
 
 def cmd_filter(args: argparse.Namespace) -> int:
+    from atl08kit.expr import ExprError, compile_expr
+    from atl08kit.filters import filter_by_expr
+    from atl08kit.io import read_table, write_table
+
     try:
-        df = read_table(args.input)
-        out, summary = filter_by_expr(df, args.expr)
-        write_table(out, args.output)
+        # compile first: a bad expression fails before any I/O, and its names drive the projection
+        compiled = compile_expr(args.expr)
+        columns = None
+        if args.keep_cols:
+            columns = list(dict.fromkeys([*args.keep_cols, *sorted(compiled.names)]))
+        if args.chunksize:
+            summary = _filter_streaming(args, compiled, columns)
+        else:
+            df = read_table(args.input, columns=columns)
+            out, summary = filter_by_expr(df, compiled, engine=args.engine, downcast=args.downcast)
+            if args.keep_cols:
+                out = out[[c for c in out.columns if c in args.keep_cols]]
+            write_table(out, args.output)
     except FileNotFoundError as e:
         print(f"[atl08kit] filter error: {e}", file=sys.stderr)
         return 2
@@ -84,8 +107,37 @@ def cmd_filter(args: argparse.Namespace) -> int:
     return 0
 
 
+def _filter_streaming(args: argparse.Namespace, compiled, columns) -> dict:
+    # filter --chunksize: read, filter and append one chunk at a time (bounded memory)
+    from atl08kit.filters import iter_filter
+    from atl08kit.io import iter_table, write_table_chunks
+
+    n_total = 0
+    n_pass = 0
+
+    def passing():
+        nonlocal n_total, n_pass
+        chunks = iter_table(args.input, columns=columns, chunksize=args.chunksize)
+        for out, s in iter_filter(chunks, compiled, engine=args.engine, downcast=args.downcast):
+            n_total += s["N_total"]
+            n_pass += s["N_pass"]
+            if args.keep_cols:
+                out = out[[c for c in out.columns if c in args.keep_cols]]
+            yield out
+
+    write_table_chunks(passing(), args.output, columns=args.keep_cols)
+    return {
+        "expr": args.expr,
+        "N_total": n_total,
+        "N_pass": n_pass,
+        "pass_rate": (n_pass / n_total) if n_total else 0.0,
+    }
+
+
+@lru_cache(maxsize=4096)
 def _norm_src_to_atl08_stem(src: str) -> str:
-     # Extract ATL08 stem from source_file (regex). Fallback: Path(src).stem.
+    # Extract ATL08 stem from source_file (regex). Fallback: Path(src).stem.
+    # Called once per unique source_file; cached since granule names repeat across tables.
     s = str(src)
     m = _ATL08_RE.search(s)
     if m:
@@ -96,6 +148,9 @@ def _norm_src_to_atl08_stem(src: str) -> str:
 def cmd_beams(args: argparse.Namespace) -> int:
     # Filter CSV to strong beams using sc_orient read from ATL08 H5 files.
     # Requires columns: beam, source_file.
+    from atl08kit.beams import build_strong_beam_map, filter_strong_beams
+    from atl08kit.io import read_table, write_table
+
     try:
         df = read_table(args.input)
     except Exception as e:
@@ -119,29 +174,25 @@ def cmd_beams(args: argparse.Namespace) -> int:
         print(f"[atl08kit] beams error: failed to read H5 folder: {e}", file=sys.stderr)
         return 2
 
-    def is_strong_row(row) -> bool:
-        key = _norm_src_to_atl08_stem(row["source_file"])
-        beam = str(row["beam"])
-        strong_beams = strong_map.get(key, [])
-        return beam in strong_beams
-
     try:
-        mask = df.apply(is_strong_row, axis=1)
-        out = df.loc[mask].copy()
+        out, summary = filter_strong_beams(df, strong_map, normalize=_norm_src_to_atl08_stem)
         write_table(out, args.output)
     except Exception as e:
         print(f"[atl08kit] beams error: {e}", file=sys.stderr)
         return 2
 
     if args.summary:
-        total = len(df)
-        kept = int(mask.sum())
-        rate = (kept / total) if total else 0.0
-        print(f"[atl08kit] beams summary: N_total={total} N_pass={kept} pass_rate={rate:.3f}")
+        print(
+            f"[atl08kit] beams summary: N_total={summary['N_total']} "
+            f"N_pass={summary['N_pass']} pass_rate={summary['pass_rate']:.3f}"
+        )
     return 0
 
 
 def cmd_raster(args: argparse.Namespace) -> int:
+    from atl08kit.io import read_table, write_table
+    from atl08kit.raster import filter_by_raster
+
     try:
         df = read_table(args.input)
 
@@ -173,6 +224,10 @@ def cmd_raster(args: argparse.Namespace) -> int:
 
 
 def cmd_vector(args: argparse.Namespace) -> int:
+    from atl08kit.io import read_table, write_table
+    from atl08kit.vector_mask import clip_points, exclude_points
+    from atl08kit.water import extract_yyyymm_from_atl08_name
+
     try:
         df = read_table(args.input)
     except Exception as e:
@@ -230,12 +285,15 @@ def cmd_vector(args: argparse.Namespace) -> int:
 
 
 def cmd_run(args: argparse.Namespace) -> int:
+    from atl08kit.io import read_table, write_table
+    from atl08kit.pipeline import run_pipeline
+
     try:
-        df = read_table(args.input)
+        df = read_table(args.input, downcast=args.compact_dtypes)
         h5_folder = args.h5_folder  # None if not provided
         expr = args.expr or None
 
-        out, summary = run_pipeline(df, h5_folder=h5_folder, expr=expr)
+        out, summary = run_pipeline(df, h5_folder=h5_folder, expr=expr, engine=args.engine)
         write_table(out, args.output)
     except Exception as e:
         print(f"[atl08kit] run error: {e}", file=sys.stderr)
@@ -254,6 +312,9 @@ def cmd_run(args: argparse.Namespace) -> int:
 
 
 def cmd_export(args: argparse.Namespace) -> int:
+    from atl08kit.export import export_points
+    from atl08kit.io import read_table
+
     try:
         df = read_table(args.input)
         export_points(
@@ -276,6 +337,10 @@ def cmd_export(args: argparse.Namespace) -> int:
 
 
 def cmd_batch(args: argparse.Namespace) -> int:
+    from atl08kit.batch import batch_run
+    from atl08kit.beams import build_strong_beam_map
+    from atl08kit.expr import ExprError, compile_expr
+
     raster_keep = [float(x) for x in args.raster_keep] if args.raster_keep else None
     raster_drop = [float(x) for x in args.raster_drop] if args.raster_drop else None
 
@@ -292,11 +357,20 @@ def cmd_batch(args: argparse.Namespace) -> int:
         return 2
 
     try:
+        # compile once; every file (and worker process) reuses the same CompiledExpr
+        compiled = compile_expr(args.expr) if args.expr else None
+    except ExprError as e:
+        print(f"[atl08kit] expression error: {e}", file=sys.stderr)
+        return 2
+
+    try:
+        # scan the H5 folder once; every CSV in the batch reuses the same map
+        strong_map = build_strong_beam_map(Path(args.h5_folder)) if args.strong_beams else None
         df_sum = batch_run(
             Path(args.in_dir),
             Path(args.out_dir),
             pattern=args.pattern,
-            expr=args.expr,
+            expr=compiled,
             # vector
             vector_mask=args.vector_mask,
             vector_mode=args.vector_mode,
@@ -316,11 +390,14 @@ def cmd_batch(args: argparse.Namespace) -> int:
             raster_band=args.raster_band,
             raster_keep_nodata=args.raster_keep_nodata,
             # beams
-            h5_folder=Path(args.h5_folder) if args.h5_folder else None,
+            strong_map=strong_map,
             strong_beams=args.strong_beams,
             # export
             export_ext=args.export,
+            out_format=f".{args.out_format}" if args.out_format else None,
+            compact_dtypes=args.compact_dtypes,
             summary_csv=Path(args.summary) if args.summary else None,
+            jobs=args.jobs,
         )
     except Exception as e:
         print(f"[atl08kit] batch error: {e}", file=sys.stderr)
@@ -331,6 +408,19 @@ def cmd_batch(args: argparse.Namespace) -> int:
     return 0
 
 
+_COMPACT_HELP = (
+    "Narrow integer columns and make low-cardinality text columns categorical on read "
+    "(less memory; integer arithmetic in --expr then runs at the narrow width)"
+)
+
+# mirrors expr._ENGINES (not imported here: keeps CLI start-up free of numpy/pandas)
+_ENGINE_CHOICES = ("auto", "python", "numexpr", "numba")
+_ENGINE_HELP = (
+    "Expression engine (default: auto). numba fuses comparisons and arithmetic into one "
+    "pass per row (JIT-compiled on first use; needs numba)"
+)
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(prog="atl08kit", description="ATL08 toolkit (MVP).")
     sub = parser.add_subparsers(dest="cmd", required=True)
@@ -338,7 +428,7 @@ def build_parser() -> argparse.ArgumentParser:
     # extract
     p_ext = sub.add_parser("extract", help="Extract ATL08 land_segments point table from H5 to CSV")
     p_ext.add_argument("--h5", required=True, help="Input ATL08 .h5 file")
-    p_ext.add_argument("--out", dest="output", required=True, help="Output CSV file")
+    p_ext.add_argument("--out", dest="output", required=True, help="Output CSV file (.parquet streams per beam)")
     p_ext.add_argument("--beams", nargs="*", default=None, help="Beams to extract, e.g. gt2l gt2r")
     p_ext.add_argument("--strong-only", action="store_true", help="Keep only strong beams (based on sc_orient)")
     p_ext.add_argument(
@@ -365,6 +455,24 @@ def build_parser() -> argparse.ArgumentParser:
     p_filter.add_argument("--in", dest="input", required=True, help="Input CSV file")
     p_filter.add_argument("--out", dest="output", required=True, help="Output CSV file")
     p_filter.add_argument("--expr", required=True, help='Filtering expression, e.g. "abs(dem_h-h_te_best_fit)<=3"')
+    p_filter.add_argument(
+        "--downcast",
+        action="store_true",
+        help="Evaluate float64 columns as float32 (faster on large tables, float32 precision)",
+    )
+    p_filter.add_argument("--engine", choices=_ENGINE_CHOICES, default="auto", help=_ENGINE_HELP)
+    p_filter.add_argument(
+        "--keep-cols",
+        nargs="+",
+        default=None,
+        help="Write only these columns; only they and the expression's columns are read",
+    )
+    p_filter.add_argument(
+        "--chunksize",
+        type=int,
+        default=None,
+        help="Stream the input in chunks of this many rows (bounded memory; CSV output)",
+    )
     p_filter.add_argument("--summary", action="store_true", help="Print filtering summary")
     p_filter.set_defaults(func=cmd_filter)
 
@@ -382,6 +490,8 @@ def build_parser() -> argparse.ArgumentParser:
     p_run.add_argument("--out", dest="output", required=True, help="Output CSV file")
     p_run.add_argument("--h5-folder", default=None, help="(Optional) ATL08 H5 folder for strong-beam filtering")
     p_run.add_argument("--expr", default="", help="(Optional) Filtering expression")
+    p_run.add_argument("--engine", choices=_ENGINE_CHOICES, default="auto", help=_ENGINE_HELP)
+    p_run.add_argument("--compact-dtypes", action="store_true", help=_COMPACT_HELP)
     p_run.add_argument("--summary", action="store_true", help="Print pipeline summary")
     p_run.set_defaults(func=cmd_run)
 
@@ -461,8 +571,16 @@ def build_parser() -> argparse.ArgumentParser:
 
     # export + summary
     p_b.add_argument("--export", default=None, help="Export extension like .geojson/.gpkg/.shp")
+    p_b.add_argument("--compact-dtypes", action="store_true", help=_COMPACT_HELP)
+    p_b.add_argument(
+        "--out-format",
+        choices=["csv", "parquet", "feather"],
+        default=None,
+        help="Output table format (default: same as input); parquet/feather skip CSV re-parsing downstream",
+    )
     p_b.add_argument("--summary", default=None, help="Write summary CSV to this path")
     p_b.add_argument("--print-summary", action="store_true", help="Print summary table to stdout")
+    p_b.add_argument("--jobs", type=int, default=1, help="Worker processes (default: 1; 0 = all cores)")
     p_b.set_defaults(func=cmd_batch)
 
     return parser
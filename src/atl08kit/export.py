@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from importlib.util import find_spec
 from pathlib import Path
 from typing import Optional, Union
 
+import numpy as np
 import pandas as pd
 
 try:
@@ -12,6 +14,10 @@ except Exception as e:  # pragma: no cover
 
 PathLike = Union[str, Path]
 
+# pyogrio writes whole columns through GDAL; fiona (the geopandas<1.0 default)
+# builds one Python record per feature. None keeps geopandas' own default.
+_IO_ENGINE = "pyogrio" if find_spec("pyogrio") is not None else None
+
 
 def _require_geopandas():
     if gpd is None:
@@ -37,9 +43,16 @@ def to_geodataframe(
     if missing:
         raise ValueError(f"Missing coordinate columns: {missing}")
 
+    # shallow copy: columns are shared with df (not duplicated), the geometry
+    # column is only added to the new frame.
+    # points_from_xy is a thin wrapper over the vectorized shapely.points (geopandas
+    # >= 0.14) that wraps the result without re-validating every geometry.
     gdf = gpd.GeoDataFrame(
-        df.copy(),
-        geometry=gpd.points_from_xy(df[lon], df[lat]),
+        df.copy(deep=False),
+        geometry=gpd.points_from_xy(
+            df[lon].to_numpy(dtype=np.float64, copy=False),
+            df[lat].to_numpy(dtype=np.float64, copy=False),
+        ),
         crs=crs,
     )
     return gdf
@@ -80,8 +93,8 @@ def export_points(
 
     # For GeoPackage, geopandas needs a layer name; default is fine but explicit is clearer.
     if driver == "GPKG":
-        gdf.to_file(out_path, driver=driver, layer="points")
+        gdf.to_file(out_path, driver=driver, layer="points", engine=_IO_ENGINE)
     else:
-        gdf.to_file(out_path, driver=driver)
+        gdf.to_file(out_path, driver=driver, engine=_IO_ENGINE)
 
     return out_path
\ No newline at end of file
@@ -1,12 +1,27 @@
 from __future__ import annotations
 
 import ast
+import copy
+import functools
+import importlib.util
+import operator
+from collections import Counter
 from dataclasses import dataclass
-from typing import Any, Dict, Mapping, Set, Callable
+from types import CodeType
+from typing import Any, Callable, Dict, Mapping, Optional, Set, Tuple
 
 import numpy as np
 import pandas as pd
 
+try:
+    import numexpr  # noqa: F401  (backend for pd.eval(engine="numexpr"))
+except Exception:  # pragma: no cover
+    numexpr = None  # type: ignore
+
+# numba backs the hot-shape kernels in atl08kit._kernels; only probe for it here,
+# the (slow) import happens on first kernel use.
+_HAVE_NUMBA = importlib.util.find_spec("numba") is not None
+
 
 class ExprError(ValueError):
     """Raised when an expression is invalid or uses disallowed syntax."""
@@ -28,6 +43,24 @@ _ALLOWED_NODES = (
 )
 
 
+# Below this many rows numexpr's setup cost outweighs its fused, threaded kernels.
+_NUMEXPR_MIN_ROWS = 100_000
+# Short-circuit "and" chains: only on frames this large, and only re-slice the
+# columns once the surviving fraction of the current rows drops below the ratio.
+_SHORT_CIRCUIT_MIN_ROWS = 10_000
+_SHORT_CIRCUIT_RATIO = 0.3
+_ENGINES = ("auto", "python", "numexpr", "numba")
+# Hot-shape numba kernels (engine="auto"): below this, JIT dispatch + thread start-up dominate.
+_KERNEL_MIN_ROWS = 100_000
+# Column dtypes the numba kernels accept. numba widens narrower ints (int8 a + b is
+# computed in int64, NumPy wraps at int8) and promotes float32 against Python floats
+# differently, so anything else falls back to the engine the kernel replaces.
+_KERNEL_DTYPES = (np.dtype(np.int64), np.dtype(np.float64))
+# engine="auto" hands large frames to numexpr only over these column dtypes: numexpr
+# upcasts int8/int16 arithmetic, the bytecode path keeps NumPy's wraparound
+_NUMEXPR_DTYPES = _KERNEL_DTYPES + (np.dtype(np.bool_), np.dtype(np.float32))
+
+
 _ALLOWED_BINOPS = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow)
 _ALLOWED_UNARYOPS = (ast.UAdd, ast.USub, ast.Not)
 _ALLOWED_BOOLOPS = (ast.And, ast.Or)
@@ -39,14 +72,283 @@ class CompiledExpr:
     expr: str
     ast_tree: ast.AST
     names: Set[str]
+    code: CodeType
+    # top-level "t1 and t2 and ..." compiled term by term (enables short-circuit eval)
+    and_terms: Tuple[CodeType, ...] = ()
+    # numba kernel for the expression: the hot shape
+    # ("abs_diff", "dem_h", "h_te_best_fit", op, 3.0) or a generated one-pass loop
+    # ("fused", scalar_body_source, column_names)
+    kernel: Optional[Tuple[Any, ...]] = None
+
+    def __reduce__(self):
+        # code objects don't pickle: rebuild from the source text (e.g. in batch worker processes)
+        return (compile_expr, (self.expr,))
+
+
+_RESERVED_PREFIX = "_atl08kit_"  # temps / helpers injected by the compiler
+# Name of the n-ary AND helper injected into the eval globals (not reachable from user input).
+_ALL_OF = _RESERVED_PREFIX + "all_of"
+
+
+def _all_of(*masks: Any) -> Any:
+    # Element-wise AND of several masks in one preallocated bool buffer
+    # (no intermediate Series / index alignment per extra comparator).
+    if any(isinstance(m, pd.Series) and not isinstance(m.dtype, np.dtype) for m in masks):
+        # nullable / Arrow-backed masks keep pandas NA semantics
+        return functools.reduce(operator.and_, masks)
+
+    arrs = [np.asarray(m) for m in masks]
+    out = np.ones(np.broadcast_shapes(*(a.shape for a in arrs)), dtype=bool)
+    for a in arrs:
+        np.logical_and(out, a, out=out)
+    return out[()] if out.ndim == 0 else out
+
+
+class _ToElementwise(ast.NodeTransformer):
+    # Rewrite boolean syntax into element-wise operators so the compiled code
+    # works on Series/arrays: and -> &, or -> |, not -> ~, a < b < c -> all_of(a < b, b < c).
+    # Runs after validation, so the bitwise nodes it introduces never come from user input.
+
+    def __init__(self) -> None:
+        self._n_tmp = 0
+
+    def visit_BoolOp(self, node: ast.BoolOp) -> ast.AST:
+        self.generic_visit(node)
+        op = ast.BitAnd() if isinstance(node.op, ast.And) else ast.BitOr()
+        out = node.values[0]
+        for v in node.values[1:]:
+            out = ast.BinOp(left=out, op=op, right=v)
+        return ast.copy_location(out, node)
+
+    def visit_UnaryOp(self, node: ast.UnaryOp) -> ast.AST:
+        self.generic_visit(node)
+        if isinstance(node.op, ast.Not):
+            return ast.copy_location(ast.UnaryOp(op=ast.Invert(), operand=node.operand), node)
+        return node
+
+    def visit_Compare(self, node: ast.Compare) -> ast.AST:
+        self.generic_visit(node)
+        if len(node.ops) == 1:
+            return node
+
+        parts: list[ast.expr] = []
+        left = node.left
+        last = len(node.ops) - 1
+        for i, (op, comp) in enumerate(zip(node.ops, node.comparators)):
+            if i < last and not isinstance(comp, (ast.Name, ast.Constant)):
+                # middle operand is shared by two comparisons: evaluate it once
+                tmp = f"_atl08kit_cmp{self._n_tmp}"
+                self._n_tmp += 1
+                right: ast.expr = ast.NamedExpr(target=ast.Name(id=tmp, ctx=ast.Store()), value=comp)
+                next_left: ast.expr = ast.Name(id=tmp, ctx=ast.Load())
+            else:
+                right = next_left = comp
+            parts.append(ast.Compare(left=left, ops=[op], comparators=[right]))
+            left = next_left
+
+        call = ast.Call(func=ast.Name(id=_ALL_OF, ctx=ast.Load()), args=parts, keywords=[])
+        return ast.copy_location(call, node)
+
+
+class _ShareRepeats(ast.NodeTransformer):
+    # Common-subexpression elimination: a subexpression that occurs more than once
+    # (same ast.dump) is computed by its first occurrence into a temp (walrus) and
+    # later occurrences read the temp, e.g. abs(a - b) <= 3 and abs(a - b) > 0.
+    # Visiting order follows Python's left-to-right evaluation order, so the binding
+    # always runs before any use (once and/or have become element-wise & / |).
+
+    _KINDS = (ast.BinOp, ast.UnaryOp, ast.Call, ast.Compare)
+
+    def __init__(self, tree: ast.AST) -> None:
+        counts = Counter(ast.dump(n) for n in ast.walk(tree) if isinstance(n, self._KINDS) and self._reads_column(n))
+        repeated = {k for k, c in counts.items() if c > 1}
+        # Occurrences nested inside a later (replaced) copy of a shared parent vanish;
+        # recount until only subexpressions that are still evaluated twice remain.
+        while True:
+            counts = Counter()
+            self._count_live(tree, repeated, set(), counts)
+            live = {k for k in repeated if counts[k] > 1}
+            if live == repeated:
+                break
+            repeated = live
+        self._repeated = repeated
+        self._bound: Dict[str, str] = {}
+
+    @classmethod
+    def _count_live(cls, node: ast.AST, repeated: Set[str], seen: Set[str], counts: Counter) -> None:
+        if isinstance(node, cls._KINDS):
+            key = ast.dump(node)
+            if key in repeated:
+                counts[key] += 1
+                if key in seen:
+                    return  # becomes a temp read; its children are never evaluated
+                seen.add(key)
+        for child in ast.iter_child_nodes(node):
+            cls._count_live(child, repeated, seen, counts)
+
+    @staticmethod
+    def _reads_column(node: ast.AST) -> bool:
+        # constant-only subtrees (-3, 2 * 1.5) are already folded by CPython's compiler
+        return any(isinstance(n, ast.Name) and n.id not in _ALLOWED_FUNCS for n in ast.walk(node))
+
+    def visit(self, node: ast.AST) -> ast.AST:
+        if not self._repeated or not isinstance(node, self._KINDS):
+            return super().visit(node)
+        key = ast.dump(node)
+        if key not in self._repeated:
+            return super().visit(node)
+
+        name = self._bound.get(key)
+        if name is not None:
+            return ast.copy_location(ast.Name(id=name, ctx=ast.Load()), node)
+        node = self.generic_visit(node)
+        name = f"_atl08kit_cse{len(self._bound)}"
+        self._bound[key] = name
+        bind = ast.NamedExpr(target=ast.Name(id=name, ctx=ast.Store()), value=node)
+        return ast.copy_location(bind, node)
+
+
+def _to_code(tree: ast.Expression) -> CodeType:
+    # validated tree -> CSE -> element-wise rewrite -> bytecode
+    tree = copy.deepcopy(tree)
+    tree = _ShareRepeats(tree).visit(tree)
+    tree = _ToElementwise().visit(tree)
+    return compile(ast.fix_missing_locations(tree), "<expr>", "eval")
+
+
+# comparison -> op code understood by atl08kit._kernels
+_HOT_OPS = {ast.LtE: 0, ast.Lt: 1, ast.GtE: 2, ast.Gt: 3}
+
+
+def _number(node: ast.AST) -> Optional[float]:
+    # numeric literal (optionally negated) -> float, else None
+    sign = 1.0
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+        sign = -1.0 if isinstance(node.op, ast.USub) else 1.0
+        node = node.operand
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return sign * float(node.value)
+    return None
+
+
+def _match_hot(tree: ast.Expression) -> Optional[Tuple[Any, ...]]:
+    # abs(x - y) <op> C  (the canonical ATL08 height-agreement filter)
+    body = tree.body
+    if not (isinstance(body, ast.Compare) and len(body.ops) == 1):
+        return None
+    op = _HOT_OPS.get(type(body.ops[0]))
+    thr = _number(body.comparators[0])
+    call = body.left
+    if op is None or thr is None:
+        return None
+    if not (isinstance(call, ast.Call) and isinstance(call.func, ast.Name) and call.func.id == "abs"):
+        return None
+    diff = call.args[0]
+    if not (
+        isinstance(diff, ast.BinOp)
+        and isinstance(diff.op, ast.Sub)
+        and isinstance(diff.left, ast.Name)
+        and isinstance(diff.right, ast.Name)
+    ):
+        return None
+    return ("abs_diff", diff.left.id, diff.right.id, op, thr)
+
+
+_FUSED_NUM_BINOPS = (ast.Add, ast.Sub, ast.Mult, ast.Div)  # no Pow: int ** -n raises in NumPy
+
+
+def _fusable_num(node: ast.AST) -> bool:
+    # scalar arithmetic numba evaluates like NumPy does element-wise
+    # (for _KERNEL_DTYPES columns; _run_fused checks those at evaluation time)
+    if isinstance(node, ast.Name):
+        return node.id not in _ALLOWED_FUNCS
+    if isinstance(node, ast.Constant):
+        return type(node.value) in (int, float)
+    if isinstance(node, ast.BinOp):
+        return isinstance(node.op, _FUSED_NUM_BINOPS) and _fusable_num(node.left) and _fusable_num(node.right)
+    if isinstance(node, ast.UnaryOp):
+        return isinstance(node.op, (ast.USub, ast.UAdd)) and _fusable_num(node.operand)
+    if isinstance(node, ast.Call):
+        return node.func.id == "abs" and _fusable_num(node.args[0])
+    return False
 
 
-def _collect_names(node: ast.AST) -> Set[str]:
-    names: Set[str] = set()
-    for n in ast.walk(node):
-        if isinstance(n, ast.Name):
-            names.add(n.id)
-    return names
+def _fusable_bool(node: ast.AST) -> bool:
+    # comparisons combined with and / or / not (bare columns as operands of
+    # and/or would be bitwise ops in the element-wise path, so they are left out)
+    if isinstance(node, ast.Compare):
+        return all(_fusable_num(v) for v in (node.left, *node.comparators))
+    if isinstance(node, ast.BoolOp):
+        return all(_fusable_bool(v) for v in node.values)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+        return _fusable_bool(node.operand)
+    return False
+
+
+class _ToScalar(ast.NodeTransformer):
+    # column name -> _c{k}[i] (k = position in the kernel's argument list)
+
+    def __init__(self) -> None:
+        self.columns: Dict[str, str] = {}
+
+    def visit_Name(self, node: ast.Name) -> ast.AST:
+        if node.id in _ALLOWED_FUNCS:
+            return node
+        arg = self.columns.setdefault(node.id, f"_c{len(self.columns)}")
+        return ast.Subscript(value=ast.Name(id=arg, ctx=ast.Load()), slice=ast.Name(id="i", ctx=ast.Load()), ctx=ast.Load())
+
+
+def _match_fused(tree: ast.Expression) -> Optional[Tuple[Any, ...]]:
+    # Boolean expression over numeric columns -> scalar loop body for _kernels.fused_mask;
+    # evaluated per row, so no intermediate arrays (and/or short-circuit per row).
+    if not _fusable_bool(tree.body):
+        return None
+    scalar = _ToScalar()
+    body = scalar.visit(copy.deepcopy(tree.body))
+    if not scalar.columns:
+        return None
+    return ("fused", ast.unparse(body), tuple(scalar.columns))
+
+
+def _run_kernel(kernel: Tuple[Any, ...], env: Mapping[str, Any]) -> Optional[np.ndarray]:
+    # Run a matched numba kernel; None when the columns don't suit it (-> generic path).
+    if kernel[0] == "fused":
+        return _run_fused(kernel, env)
+    _, x, y, op, thr = kernel
+    a, b = env[x], env[y]
+    # never change the answer of the engine the kernel replaces (see _KERNEL_DTYPES)
+    if not all(v.dtype in _KERNEL_DTYPES for v in (a, b)):
+        return None
+    a = np.ascontiguousarray(a.to_numpy())
+    b = np.ascontiguousarray(b.to_numpy())
+
+    from atl08kit import _kernels
+
+    return _kernels.abs_diff_cmp(a, b, thr, op)
+
+
+def _run_fused(kernel: Tuple[Any, ...], env: Mapping[str, Any]) -> Optional[np.ndarray]:
+    _, body, names = kernel
+    cols = [env[c] for c in names]
+    if not all(v.dtype in _KERNEL_DTYPES for v in cols):
+        return None
+
+    from atl08kit import _kernels
+
+    fn = _kernels.fused_mask(body, len(cols))
+    return fn(*(np.ascontiguousarray(v.to_numpy()) for v in cols))
+
+
+def _is_mask(node: ast.AST) -> bool:
+    # Node that always evaluates to a bool mask. Only such "and" terms are split for
+    # short-circuit evaluation: "a > 0 and k" (int k) is a bitwise & and stays whole.
+    if isinstance(node, ast.Compare):
+        return True
+    if isinstance(node, ast.BoolOp):
+        return all(_is_mask(v) for v in node.values)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+        return _is_mask(node.operand)
+    return False
 
 
 def compile_expr(expr: str) -> CompiledExpr:
@@ -56,19 +358,40 @@ def compile_expr(expr: str) -> CompiledExpr:
     except SyntaxError as e:
         raise ExprError(f"Invalid expression syntax: {e}") from e
 
-    _validate_ast(tree)
-    names = _collect_names(tree)
-    # keep only column names(exclude allowed function names)
-    names = {n for n in names if n not in _ALLOWED_FUNCS}
+    names = _validate_ast(tree)
+    reserved = sorted(n for n in names if n.startswith(_RESERVED_PREFIX))
+    if reserved:
+        raise ExprError(f"Names starting with {_RESERVED_PREFIX!r} are reserved: {reserved}")
 
-    return CompiledExpr(expr=expr, ast_tree=tree, names=names)
+    # compile once to bytecode; evaluation is then a plain eval() per frame
+    code = _to_code(tree)
 
+    and_terms: Tuple[CodeType, ...] = ()
+    if (
+        isinstance(tree.body, ast.BoolOp)
+        and isinstance(tree.body.op, ast.And)
+        and all(_is_mask(v) for v in tree.body.values)
+    ):
+        # each term runs on its own (possibly row-subset) env, so share only within a term
+        and_terms = tuple(_to_code(ast.Expression(v)) for v in tree.body.values)
 
-def _validate_ast(node: ast.AST) -> None:
+    kernel = (_match_hot(tree) or _match_fused(tree)) if _HAVE_NUMBA else None
+    return CompiledExpr(expr=expr, ast_tree=tree, names=names, code=code, and_terms=and_terms, kernel=kernel)
+
+
+def _validate_ast(node: ast.AST) -> Set[str]:
+    # Validate every node and collect the referenced column names in the same walk
+    # (Names other than the allowed function names).
+    names: Set[str] = set()
     for n in ast.walk(node):
         if not isinstance(n, _ALLOWED_NODES):
             raise ExprError(f"Disallowed syntax: {type(n).__name__}")
 
+        if isinstance(n, ast.Name):
+            if n.id not in _ALLOWED_FUNCS:
+                names.add(n.id)
+            continue
+
         if isinstance(n, ast.BinOp) and not isinstance(n.op, _ALLOWED_BINOPS):
             raise ExprError(f"Disallowed operator: {type(n.op).__name__}")
 
@@ -83,6 +406,10 @@ def _validate_ast(node: ast.AST) -> None:
                 if not isinstance(op, _ALLOWED_CMPOPS):
                     raise ExprError(f"Disallowed comparison operator: {type(op).__name__}")
 
+        if isinstance(n, ast.Constant):
+            if not (isinstance(n.value, (int, float, bool)) or n.value is None):
+                raise ExprError(f"Only numeric/bool constants are allowed, got: {type(n.value).__name__}")
+
         if isinstance(n, ast.Call):
             if not isinstance(n.func, ast.Name):
                 raise ExprError("Only simple function calls like abs(x) are allowed.")
@@ -94,9 +421,30 @@ def _validate_ast(node: ast.AST) -> None:
             if len(n.args) != 1:
                 raise ExprError(f"Function '{func_name}' must take exactly 1 argument.")
 
+    return names
+
+
+def eval_expr(
+    compiled: CompiledExpr,
+    df: pd.DataFrame,
+    *,
+    engine: str = "auto",
+    downcast: bool = False,
+) -> np.ndarray:
+    # Evaluate expression on df -> boolean mask (bool ndarray, one entry per row).
+    # engine: "python" (compiled bytecode), "numexpr" (pd.eval fused kernels),
+    # "numba" (one fused pass per row when the shape/dtypes allow, else "python"),
+    # "auto" (numexpr when installed, df has >= _NUMEXPR_MIN_ROWS rows and the columns
+    # are _NUMEXPR_DTYPES; the disk-cached abs(x - y) <op> C kernel from _KERNEL_MIN_ROWS rows).
+    # downcast: evaluate float64 columns as float32 (half the memory traffic;
+    # thresholds are compared at float32 precision).
+    if engine not in _ENGINES:
+        raise ValueError(f"engine must be one of {_ENGINES}, got: {engine!r}")
+    if engine == "numexpr" and numexpr is None:
+        raise ImportError("numexpr is required for engine='numexpr'. Install it first, e.g.\n  pip install numexpr")
+    if engine == "numba" and not _HAVE_NUMBA:
+        raise ImportError("numba is required for engine='numba'. Install it first, e.g.\n  pip install numba")
 
-def eval_expr(compiled: CompiledExpr, df: pd.DataFrame) -> pd.Series:
-    # Evaluate expression on df -> boolean mask (Series).
     missing = [c for c in compiled.names if c not in df.columns]
     if missing:
         raise ExprError(f"Expression references missing columns: {missing}")
@@ -104,111 +452,95 @@ def eval_expr(compiled: CompiledExpr, df: pd.DataFrame) -> pd.Series:
     env: Dict[str, Any] = {}
     # expose columns
     for c in compiled.names:
-        env[c] = df[c]
-    # expose allowed functions
-    env.update(_ALLOWED_FUNCS)
-
-    result = _eval_node(compiled.ast_tree.body, env)
-
-    # Normalize to boolean Series
+        col = df[c]
+        if downcast and col.dtype == np.float64:
+            col = col.astype(np.float32)
+        env[c] = col
+
+    result = None
+    if compiled.kernel is not None and (
+        engine == "numba"
+        # generated kernels JIT-compile on first use (not cached on disk): opt-in only
+        or (engine == "auto" and compiled.kernel[0] != "fused" and len(df) >= _KERNEL_MIN_ROWS)
+    ):
+        result = _run_kernel(compiled.kernel, env)
+
+    use_numexpr = result is None and (
+        engine == "numexpr"
+        or (
+            engine == "auto"
+            and numexpr is not None
+            and len(df) >= _NUMEXPR_MIN_ROWS
+            and all(v.dtype in _NUMEXPR_DTYPES for v in env.values())
+        )
+    )
+    if use_numexpr:
+        # The AST validator stays the security gate; numexpr is only the executor.
+        try:
+            result = pd.eval(compiled.expr, engine="numexpr", parser="pandas", local_dict=env, global_dict={})
+        except Exception:
+            result = None  # constructs numexpr can't handle -> python path below
+
+    if result is None:
+        # no builtins: only the exposed columns and whitelisted functions are reachable
+        glb = {"__builtins__": {}, _ALL_OF: _all_of}
+        if (
+            compiled.and_terms
+            and len(df) >= _SHORT_CIRCUIT_MIN_ROWS
+            and all(isinstance(v.dtype, np.dtype) for v in env.values())
+        ):
+            result = _eval_and_short_circuit(compiled.and_terms, glb, env, len(df))
+        else:
+            # expose allowed functions
+            env.update(_ALLOWED_FUNCS)
+            result = eval(compiled.code, glb, env)
+
+    # Normalize to a plain bool ndarray (callers index positionally; no Series/index needed)
     if isinstance(result, (pd.Series, np.ndarray)):
         # comparisons / boolean ops should yield bool; but users might write numeric expr by mistake
-        if getattr(result, "dtype", None) is not None and result.dtype != bool:
+        if getattr(result, "dtype", None) is not None and not pd.api.types.is_bool_dtype(result.dtype):
             raise ExprError("Expression must evaluate to a boolean mask (use comparisons like <, ==, etc.).")
-        return pd.Series(result, index=df.index, dtype=bool)
+        if isinstance(result, pd.Series):
+            # nullable / Arrow-backed bool: missing compares as False (like NaN in numpy)
+            return result.to_numpy(dtype=bool, na_value=False)
+        return np.asarray(result, dtype=bool)
 
     if isinstance(result, (bool, np.bool_)):
         # broadcast scalar boolean
-        return pd.Series([bool(result)] * len(df), index=df.index, dtype=bool)
+        return np.full(len(df), bool(result))
 
     raise ExprError("Expression must evaluate to a boolean mask.")
 
 
-def _eval_node(node: ast.AST, env: Mapping[str, Any]) -> Any:
-    # Constants
-    if isinstance(node, ast.Constant):
-        if isinstance(node.value, (int, float, bool)) or node.value is None:
-            return node.value
-        raise ExprError(f"Only numeric/bool constants are allowed, got: {type(node.value).__name__}")
-
-    # Variables
-    if isinstance(node, ast.Name):
-        if node.id not in env:
-            raise ExprError(f"Unknown name: {node.id}")
-        return env[node.id]
-
-    # Unary ops
-    if isinstance(node, ast.UnaryOp):
-        operand = _eval_node(node.operand, env)
-        if isinstance(node.op, ast.Not):
-            return ~operand
-        if isinstance(node.op, ast.UAdd):
-            return +operand
-        if isinstance(node.op, ast.USub):
-            return -operand
-
-    # Binary ops
-    if isinstance(node, ast.BinOp):
-        left = _eval_node(node.left, env)
-        right = _eval_node(node.right, env)
-        if isinstance(node.op, ast.Add):
-            return left + right
-        if isinstance(node.op, ast.Sub):
-            return left - right
-        if isinstance(node.op, ast.Mult):
-            return left * right
-        if isinstance(node.op, ast.Div):
-            return left / right
-        if isinstance(node.op, ast.Pow):
-            return left ** right
-
-    # Bool ops
-    if isinstance(node, ast.BoolOp):
-        values = [_eval_node(v, env) for v in node.values]
-        if isinstance(node.op, ast.And):
-            out = values[0]
-            for v in values[1:]:
-                out = out & v
-            return out
-        if isinstance(node.op, ast.Or):
-            out = values[0]
-            for v in values[1:]:
-                out = out | v
-            return out
-
-    # Comparisons (chain supported: a < b < c)
-    if isinstance(node, ast.Compare):
-        left = _eval_node(node.left, env)
-        out = None
-        for op, comp in zip(node.ops, node.comparators):
-            right = _eval_node(comp, env)
-
-            if isinstance(op, ast.Lt):
-                cur = left < right
-            elif isinstance(op, ast.LtE):
-                cur = left <= right
-            elif isinstance(op, ast.Gt):
-                cur = left > right
-            elif isinstance(op, ast.GtE):
-                cur = left >= right
-            elif isinstance(op, ast.Eq):
-                cur = left == right
-            elif isinstance(op, ast.NotEq):
-                cur = left != right
-            else:
-                raise ExprError(f"Unsupported comparison operator: {type(op).__name__}")
-
-            out = cur if out is None else (out & cur)
-            left = right
-        return out
-
-    # Function calls
-    if isinstance(node, ast.Call):
-        func_name = node.func.id  # validated already
-        func = env.get(func_name, None)
-        if func is None:
-            raise ExprError(f"Unknown function: {func_name}")
-        arg = _eval_node(node.args[0], env)
-        return func(arg)
-
-    raise ExprError(f"Unsupported expression element: {type(node).__name__}")
+def _eval_and_short_circuit(
+    terms: Tuple[CodeType, ...],
+    glb: Dict[str, Any],
+    cols: Mapping[str, pd.Series],
+    n: int,
+) -> np.ndarray:
+    # Evaluate "t1 and t2 and ..." left to right; once few rows survive, later
+    # terms only see the surviving rows. Every term is element-wise, so the
+    # result equals the full evaluation.
+    alive = np.ones(n, dtype=bool)
+    pos: np.ndarray | None = None  # surviving row positions (None = all rows)
+    env: Dict[str, Any] = {**cols, **_ALLOWED_FUNCS}
+
+    for i, code in enumerate(terms):
+        r = np.asarray(eval(code, glb, env))
+        if r.dtype != bool:
+            raise ExprError("Expression must evaluate to a boolean mask (use comparisons like <, ==, etc.).")
+        if pos is None:
+            alive &= r
+        else:
+            alive[pos] &= r  # pos may include rows an earlier term already dropped
+
+        n_cur = n if pos is None else len(pos)
+        n_alive = int(alive.sum())
+        if i == len(terms) - 1 or n_alive == 0:
+            break
+        if n_alive < _SHORT_CIRCUIT_RATIO * n_cur:
+            pos = np.flatnonzero(alive)
+            env = {c: s.iloc[pos] for c, s in cols.items()}
+            env.update(_ALLOWED_FUNCS)
+
+    return alive
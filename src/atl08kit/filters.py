@@ -1,21 +1,51 @@
 from __future__ import annotations
 
-from typing import Dict, Tuple
+from typing import Dict, Iterable, Iterator, Tuple, Union
+import numpy as np
 import pandas as pd
 
-from atl08kit.expr import compile_expr, eval_expr
+from atl08kit.expr import CompiledExpr, compile_expr, eval_expr
 
 
-def filter_by_expr(df: pd.DataFrame, expr: str) -> Tuple[pd.DataFrame, Dict[str, float]]:
+def _as_compiled(expr: Union[str, CompiledExpr]) -> CompiledExpr:
+    return expr if isinstance(expr, CompiledExpr) else compile_expr(expr)
+
+
+def filter_by_expr(
+    df: pd.DataFrame,
+    expr: Union[str, CompiledExpr],
+    *,
+    engine: str = "auto",
+    downcast: bool = False,
+) -> Tuple[pd.DataFrame, Dict[str, float]]:
     # Filter rows using a safe boolean expression on columns
-    compiled = compile_expr(expr)
-    mask = eval_expr(compiled, df)
-    out = df.loc[mask].copy()
+    # (downcast=True evaluates float64 columns as float32; output rows keep original dtypes)
+    # expr may be pre-compiled (compile_expr) to reuse it across many frames
+    compiled = _as_compiled(expr)
+    mask = eval_expr(compiled, df, engine=engine, downcast=downcast)
+    # positional gather: one take per block, no label alignment of the mask
+    out = df.take(np.flatnonzero(mask))
 
     summary = {
-        "expr": expr,
+        "expr": compiled.expr,
         "N_total": int(len(df)),
         "N_pass": int(mask.sum()),
         "pass_rate": float(mask.mean()) if len(df) else 0.0,
     }
-    return out, summary
\ No newline at end of file
+    return out, summary
+
+
+def iter_filter(
+    chunks: Iterable[pd.DataFrame],
+    expr: Union[str, CompiledExpr],
+    *,
+    engine: str = "auto",
+    downcast: bool = False,
+) -> Iterator[Tuple[pd.DataFrame, Dict[str, float]]]:
+    # Chunked filter_by_expr: compile once, yield (passing rows, chunk summary) per chunk.
+    # Callers accumulate N_total / N_pass across chunks.
+    compiled = _as_compiled(expr)
+    for chunk in chunks:
+        mask = eval_expr(compiled, chunk, engine=engine, downcast=downcast)
+        out = chunk.take(np.flatnonzero(mask))
+        yield out, {"N_total": int(len(chunk)), "N_pass": int(len(out))}
@@ -1,29 +1,182 @@
 from __future__ import annotations
 
+import fnmatch
+import os
 from pathlib import Path
-from typing import Union
+from typing import Iterable, Iterator, List, Optional, Sequence, Union
 
+import numpy as np
 import pandas as pd
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+except Exception:  # pragma: no cover
+    pa = None  # type: ignore
+    pacsv = None  # type: ignore
+    pq = None  # type: ignore
+
 
 PathLike = Union[str, Path]
 
+_CSV_ENGINES = ("c", "pyarrow")
+
+
+def read_table(
+    path: PathLike,
+    *,
+    columns: Optional[Sequence[str]] = None,
+    downcast: bool = False,
+    csv_engine: str = "c",
+) -> pd.DataFrame:
+    # Read a CSV, Parquet or Feather file into a DataFrame.
+    # columns: load only these columns (CSV usecols / columnar projection).
+    # downcast: shrink dtypes after reading (see _auto_downcast).
+    # csv_engine: "c" (pandas' parser, same as iter_table) or "pyarrow" (multithreaded,
+    # opt-in: Arrow's type inference can differ, e.g. uint64 beyond int64 -> float64).
+    if csv_engine not in _CSV_ENGINES:
+        raise ValueError(f"csv_engine must be one of {_CSV_ENGINES}, got: {csv_engine!r}")
+    df = _read_any(Path(path), columns, csv_engine)
+    return _auto_downcast(df) if downcast else df
+
+
+def _read_any(p: Path, columns: Optional[Sequence[str]], csv_engine: str) -> pd.DataFrame:
+    if not p.exists():
+        raise FileNotFoundError(f"Input file not found: {p}")
+
+    cols = list(columns) if columns is not None else None
+    suffix = p.suffix.lower()
+    if suffix == ".csv":
+        if csv_engine == "pyarrow":
+            return _read_csv_arrow(p, cols)
+        return pd.read_csv(p, usecols=cols)
+    if suffix == ".parquet":
+        # e.g. `extract --out x.parquet`; unused columns are never decoded
+        return pd.read_parquet(p, columns=cols)
+    if suffix == ".feather":
+        return pd.read_feather(p, columns=cols)
+
+    raise ValueError(f"Unsupported input format: {suffix}. Supported: .csv, .parquet, .feather")
+
+
+# text columns with fewer distinct values than this fraction of rows become categorical
+_CATEGORY_MAX_RATIO = 0.5
+
+
+def _auto_downcast(df: pd.DataFrame, *, keep_precision: bool = True) -> pd.DataFrame:
+    # Smallest safe integer width per column (flags like terrain_flg / cloud_flag_atm
+    # fit in 1 byte) and categorical for low-cardinality text (beam, source_file).
+    # Floats stay float64 unless keep_precision=False.
+    # Note: later integer arithmetic runs at the narrow width (int8 * 100 wraps).
+    changed = {}
+    n = len(df)
+    for c in df.columns:
+        s = df[c]
+        kind = s.dtype.kind if isinstance(s.dtype, np.dtype) else None
+        if kind in ("i", "u") and n:
+            # signed only: unsigned flags would wrap in differences like a - b
+            small = pd.to_numeric(s, downcast="integer")
+            if small.dtype.itemsize < s.dtype.itemsize:
+                changed[c] = small
+        elif kind == "f" and not keep_precision:
+            changed[c] = pd.to_numeric(s, downcast="float")
+        elif (kind == "O" or pd.api.types.is_string_dtype(s.dtype)) and n:
+            if s.nunique(dropna=False) < _CATEGORY_MAX_RATIO * n:
+                changed[c] = s.astype("category")
+    if not changed:
+        return df
+    out = df.copy(deep=False)
+    for c, s in changed.items():
+        out[c] = s
+    return out
+
+
+# pandas' default NA markers (pd.read_csv na_values): the Arrow reader would keep
+# "None" / "<NA>" as text and turns a numeric column holding them into strings
+_PANDAS_NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+]
+
 
-def read_table(path: PathLike) -> pd.DataFrame:
-    # Read a CSV file into a DataFrame
+def _read_csv_arrow(p: Path, cols: Optional[List[str]]) -> pd.DataFrame:
+    # pyarrow's CSV reader parses blocks on several threads; pandas' C parser is the
+    # fallback (pyarrow missing, duplicate header names pandas would rename to "a.1",
+    # or input the Arrow reader rejects, e.g. ragged rows).
+    if pacsv is None:
+        return pd.read_csv(p, usecols=cols)
+    try:
+        with pacsv.open_csv(p) as reader:
+            header = reader.schema.names
+        if len(set(header)) != len(header):
+            raise ValueError("duplicate column names")
+        include = []
+        if cols is not None:
+            # file order, like usecols; unknown names -> C parser raises the usual error
+            if not set(cols) <= set(header):
+                raise KeyError(cols)
+            include = [c for c in header if c in set(cols)]
+        opts = dict(include_columns=include, null_values=_PANDAS_NA_VALUES, strings_can_be_null=True)
+        tbl = pacsv.read_csv(p, convert_options=pacsv.ConvertOptions(**opts))
+        temporal = [f.name for f in tbl.schema if pa.types.is_temporal(f.type)]
+        if temporal:
+            # Arrow infers timestamps; the C parser keeps the text (and so must we,
+            # or pass-through columns get rewritten on output)
+            as_text = pacsv.ConvertOptions(**opts, column_types={c: pa.string() for c in temporal})
+            tbl = pacsv.read_csv(p, convert_options=as_text)
+    except Exception:
+        return pd.read_csv(p, usecols=cols)
+    # numpy-backed columns: expression kernels, raster and vector code take plain ndarrays
+    return tbl.to_pandas()
+
+
+def iter_table(
+    path: PathLike,
+    *,
+    columns: Optional[Sequence[str]] = None,
+    chunksize: int = 100_000,
+) -> Iterator[pd.DataFrame]:
+    # Read a CSV, Parquet or Feather file as DataFrames of at most chunksize rows.
+    # Memory stays bounded by one chunk regardless of file size.
     p = Path(path)
     if not p.exists():
         raise FileNotFoundError(f"Input file not found: {p}")
+    if chunksize <= 0:
+        raise ValueError("chunksize must be > 0")
 
+    cols = list(columns) if columns is not None else None
     suffix = p.suffix.lower()
     if suffix == ".csv":
-        return pd.read_csv(p)
+        with pd.read_csv(p, usecols=cols, chunksize=chunksize) as reader:
+            yield from reader
+        return
+    if suffix == ".parquet":
+        if pq is None:
+            raise ImportError("pyarrow is required to read Parquet input (pip install pyarrow)")
+        pf = pq.ParquetFile(p)
+        for batch in pf.iter_batches(batch_size=chunksize, columns=cols):
+            yield batch.to_pandas()
+        return
+    if suffix == ".feather":
+        if pa is None:
+            raise ImportError("pyarrow is required to read Feather input (pip install pyarrow)")
+        # Arrow IPC file, memory-mapped: zero-copy for uncompressed files; the lz4-compressed
+        # ones write_table produces are decompressed into memory by read_all (whole table)
+        with pa.memory_map(str(p)) as source:
+            tbl = pa.ipc.open_file(source).read_all()
+            if cols is not None:
+                tbl = tbl.select(cols)
+            for batch in tbl.to_batches(max_chunksize=chunksize):
+                yield batch.to_pandas()
+        return
 
-    raise ValueError(f"Unsupported input format: {suffix}. Only .csv is supported for now.")
+    raise ValueError(f"Unsupported input format: {suffix}. Supported: .csv, .parquet, .feather")
 
 
 def write_table(df: pd.DataFrame, path: PathLike) -> None:
-    # Write a DataFrame to CSV
+    # Write a DataFrame to CSV, Parquet (zstd) or Feather.
+    # The columnar formats keep dtypes and skip text parsing when a later stage reads them.
     p = Path(path)
     p.parent.mkdir(parents=True, exist_ok=True)
 
@@ -31,5 +184,55 @@ def write_table(df: pd.DataFrame, path: PathLike) -> None:
     if suffix == ".csv":
         df.to_csv(p, index=False)
         return
+    if suffix == ".parquet":
+        df.to_parquet(p, compression="zstd", index=False)
+        return
+    if suffix == ".feather":
+        # feather stores no index; filtered frames carry a non-default one
+        df.reset_index(drop=True).to_feather(p)
+        return
+
+    raise ValueError(f"Unsupported output format: {suffix}. Supported: .csv, .parquet, .feather")
+
+
+def write_table_chunks(
+    chunks: Iterable[pd.DataFrame],
+    path: PathLike,
+    *,
+    columns: Optional[Sequence[str]] = None,
+) -> int:
+    # Append DataFrames to one CSV (header from the first chunk); returns rows written.
+    # No chunks at all: header-only CSV from columns, or no file when columns is None
+    # (a zero-byte CSV has no header and cannot be read back).
+    p = Path(path)
+    p.parent.mkdir(parents=True, exist_ok=True)
+
+    suffix = p.suffix.lower()
+    if suffix != ".csv":
+        raise ValueError(f"Unsupported output format: {suffix}. Only .csv is supported for now.")
+
+    n = 0
+    first = True
+    for chunk in chunks:
+        chunk.to_csv(p, index=False, mode="w" if first else "a", header=first)
+        first = False
+        n += len(chunk)
+    if first and columns is not None:
+        pd.DataFrame(columns=list(columns)).to_csv(p, index=False)
+    return n
+
+
+def list_files(folder: PathLike, pattern: str = "*") -> List[Path]:
+    # Files in folder whose name matches pattern, sorted by name.
+    # One os.scandir pass (dirent type, no per-entry stat); patterns with a
+    # directory part ("sub/*.csv", "**/*.csv") fall back to Path.glob.
+    folder = Path(folder)
+    if "/" in pattern or os.sep in pattern:
+        return sorted(p for p in folder.glob(pattern) if p.is_file())
+    if not folder.is_dir():
+        return []
 
-    raise ValueError(f"Unsupported output format: {suffix}. Only .csv is supported for now.")
\ No newline at end of file
+    with os.scandir(folder) as it:
+        names = [e.name for e in it if fnmatch.fnmatch(e.name, pattern) and e.is_file()]
+    names.sort()
+    return [folder / n for n in names]
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Mapping, Optional, Tuple
 
 import pandas as pd
 
-from atl08kit.beams import build_strong_beam_map
+from atl08kit.beams import build_strong_beam_map, filter_strong_beams
 from atl08kit.filters import filter_by_expr
 from atl08kit.expr import ExprError
 
@@ -20,29 +22,23 @@ class RunSummary:
     filter_pass_rate: float
 
 
-def _norm_src_name(src: str) -> str:
-    # Strip CSV suffixes so "source_file" matches ATL08 H5 stem
-    base = Path(str(src)).stem  # drop .csv
-    for suffix in [
-        "_Rule8_full",
-        "_Rule7_full",
-        "_Rule6_full",
-        "_Rule5_full",
-        "_Rule4_full",
-        "_Rule3_full",
-        "_Rule2_full",
-        "_Rule1_full",
-        "_raw_allpoints",
-    ]:
-        if base.endswith(suffix):
-            base = base[: -len(suffix)]
-    return base
+@lru_cache(maxsize=8)
+def _cached_strong_beam_map(folder: str, mtime_ns: int) -> Mapping[str, FrozenSet[str]]:
+    # mtime_ns is part of the key only: adding/removing/renaming H5 files bumps the
+    # folder mtime and so forces a rescan. Read-only view: the result is shared.
+    strong_map = build_strong_beam_map(folder)
+    return MappingProxyType({k: frozenset(v) for k, v in strong_map.items()})
+
+
+def _strong_beam_map(h5_folder: Path) -> Mapping[str, FrozenSet[str]]:
+    # Scan each H5 folder once per process, not once per apply_strong_beams call.
+    folder = h5_folder.resolve()
+    return _cached_strong_beam_map(str(folder), folder.stat().st_mtime_ns)
 
 
 def apply_strong_beams(df: pd.DataFrame, h5_folder: str | Path) -> Tuple[pd.DataFrame, Dict[str, float]]:
     # Keep rows where (source_file, beam) is a strong beam for that ATL08 file
-    needed_cols = {"beam", "source_file"}
-    missing = needed_cols - set(df.columns)
+    missing = [c for c in ("beam", "source_file") if c not in df.columns]
     if missing:
         raise ValueError(f"apply_strong_beams: input missing columns: {sorted(missing)}")
 
@@ -50,23 +46,10 @@ def apply_strong_beams(df: pd.DataFrame, h5_folder: str | Path) -> Tuple[pd.Data
     if not h5_folder.exists():
         raise FileNotFoundError(f"apply_strong_beams: h5-folder not found: {h5_folder}")
 
-    strong_map = build_strong_beam_map(h5_folder)
-
-    def is_strong_row(row) -> bool:
-        key = _norm_src_name(row["source_file"])
-        beam = str(row["beam"])
-        strong_beams = strong_map.get(key, [])
-        return beam in strong_beams
-
-    mask = df.apply(is_strong_row, axis=1)
-    out = df.loc[mask].copy()
-
-    summary = {
-        "N_total": int(len(df)),
-        "N_pass": int(mask.sum()),
-        "pass_rate": float(mask.mean()) if len(df) else 0.0,
-    }
-    return out, summary
+    strong_map = _strong_beam_map(h5_folder)
+    # vectorized: normalize once per unique source_file (beams.norm_src_name),
+    # then one gather over factorized codes
+    return filter_strong_beams(df, strong_map)
 
 
 def run_pipeline(
@@ -74,8 +57,10 @@ def run_pipeline(
     *,
     h5_folder: Optional[str | Path] = None,
     expr: Optional[str] = None,
+    engine: str = "auto",
 ) -> Tuple[pd.DataFrame, RunSummary]:
     # Pipeline: optional strong-beam filter -> optional expr filter
+    # (engine: expression engine, see expr.eval_expr)
     n_in = len(df)
 
     if h5_folder is not None:
@@ -89,7 +74,7 @@ def run_pipeline(
 
     if expr is not None:
         try:
-            df_f, fsum = filter_by_expr(df_b, expr)
+            df_f, fsum = filter_by_expr(df_b, expr, engine=engine)
         except ExprError as e:
             raise ExprError(f"run_pipeline: invalid expr: {e}") from e
         n_f = len(df_f)
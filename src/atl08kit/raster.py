@@ -9,11 +9,20 @@ import pandas as pd
 
 try:
     import rasterio
+    from rasterio.windows import Window
 except Exception:  # pragma: no cover
     rasterio = None  # type: ignore
+    Window = None  # type: ignore
 
 PathLike = Union[str, Path]
 
+# Points are sampled from one windowed read over their bounding box when that box is
+# dense enough: at most _WINDOW_OVERREAD times the cells of one block per point (what the
+# per-block path reads at worst), and never more than _MAX_WINDOW_CELLS. Sparser point
+# sets (e.g. two points in opposite corners) read only the blocks that contain points.
+_WINDOW_OVERREAD = 4
+_MAX_WINDOW_CELLS = 1 << 26
+
 
 def _require_rasterio() -> None:
     # Hard dependency for raster sampling / filtering
@@ -58,12 +67,23 @@ def sample_raster(
         vals = np.array([], dtype=float)
         return vals, RasterSampleSummary(str(rp), 0, 0, None)
 
-    coords = list(zip(df[lon].astype(float).values, df[lat].astype(float).values))
+    # float64 columns come back as views (no copy); only read from here on
+    xs = df[lon].to_numpy(dtype=np.float64, copy=False)
+    ys = df[lat].to_numpy(dtype=np.float64, copy=False)
 
     with rasterio.open(rp) as src:
         nodata = src.nodata
-        samples = list(src.sample(coords, indexes=band))
-        vals = np.array([s[0] if s is not None and len(s) else np.nan for s in samples], dtype=float)
+        # world -> pixel for all points at once (inverse affine, floor like src.index)
+        cols_f, rows_f = ~src.transform * (xs, ys)
+        # NaN coordinates compare False here, so they count as outside
+        inside = (rows_f >= 0) & (rows_f < src.height) & (cols_f >= 0) & (cols_f < src.width)
+
+        # outside the raster: same fill as src.sample's boundless read (nodata, else 0)
+        vals = np.full(len(xs), 0.0 if nodata is None else float(nodata))
+        if inside.any():
+            rows = np.floor(rows_f[inside]).astype(np.int64)
+            cols = np.floor(cols_f[inside]).astype(np.int64)
+            vals[inside] = _read_cells(src, band, rows, cols)
 
     # Replace explicit nodata with NaN so downstream logic is consistent
     if nodata is not None:
@@ -79,6 +99,32 @@ def sample_raster(
     return vals, summary
 
 
+def _read_cells(src, band: int, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+    # Values of band at in-bounds pixel (rows, cols): one read + one fancy-index gather.
+    r0, c0 = int(rows.min()), int(cols.min())
+    h, w = int(rows.max()) - r0 + 1, int(cols.max()) - c0 + 1
+    bh, bw = src.block_shapes[band - 1]
+    if h * w <= min(_MAX_WINDOW_CELLS, _WINDOW_OVERREAD * len(rows) * bh * bw):
+        arr = src.read(band, window=Window(c0, r0, w, h))
+        return arr[rows - r0, cols - c0].astype(float)
+
+    # Sparse points: read each internal block that holds points once.
+    n_bcols = -(-src.width // bw)
+    block = (rows // bh) * n_bcols + cols // bw
+    order = np.argsort(block, kind="stable")
+    blocks, starts = np.unique(block[order], return_index=True)
+    ends = np.append(starts[1:], len(order))
+
+    out = np.empty(len(rows), dtype=float)
+    for b, lo, hi in zip(blocks, starts, ends):
+        idx = order[lo:hi]
+        br, bc = divmod(int(b), n_bcols)
+        y0, x0 = br * bh, bc * bw
+        arr = src.read(band, window=Window(x0, y0, min(bw, src.width - x0), min(bh, src.height - y0)))
+        out[idx] = arr[rows[idx] - y0, cols[idx] - x0]
+    return out
+
+
 def filter_by_raster(
     df: pd.DataFrame,
     raster_path: PathLike,
@@ -100,21 +146,21 @@ def filter_by_raster(
     if df.empty:
         return df.copy(), {"N_total": 0, "N_pass": 0, "pass_rate": 0.0, "N_nodata": 0}
 
-    # Start with nodata policy
-    if keep_nodata:
-        mask = np.ones(len(df), dtype=bool)
-    else:
-        mask = ~np.isnan(vals)
-
+    # One membership pass writes the mask; at most one more in-place pass applies the
+    # nodata policy. np.isin compares in C; NaN never matches a value, so it fails
+    # keep_values (whatever keep_nodata says, as before) and passes drop_values.
     if keep_values is not None:
-        kv = set(float(x) for x in keep_values)
-        mask = mask & np.array([False if np.isnan(v) else (float(v) in kv) for v in vals], dtype=bool)
-
-    if drop_values is not None:
-        dv = set(float(x) for x in drop_values)
-        mask = mask & np.array([True if np.isnan(v) else (float(v) not in dv) for v in vals], dtype=bool)
+        kv = np.fromiter((float(x) for x in keep_values), dtype=float)
+        mask = np.isin(vals, kv)
+    elif drop_values is not None:
+        dv = np.fromiter((float(x) for x in drop_values), dtype=float)
+        mask = np.isin(vals, dv, invert=True)
+        if not keep_nodata:
+            mask &= ~np.isnan(vals)
+    else:
+        mask = np.ones(len(df), dtype=bool) if keep_nodata else ~np.isnan(vals)
 
-    out = df.loc[mask].copy()
+    out = df.take(np.flatnonzero(mask))
 
     summary = {
         "raster": str(raster_path),
@@ -135,8 +181,10 @@ def add_raster_column(
     lat: str = "lat",
     band: int = 1,
 ) -> tuple[pd.DataFrame, RasterSampleSummary]:
-     # Add sampled raster values as df[out_col]
+    # Add sampled raster values as df[out_col]
+    # Shallow copy: the existing columns are shared with df, not duplicated
+    # (callers must not mutate them in place; df itself never gains out_col).
     vals, s = sample_raster(df, raster_path, lon=lon, lat=lat, band=band)
-    out = df.copy()
+    out = df.copy(deep=False)
     out[out_col] = vals
     return out, s
\ No newline at end of file
@@ -1,18 +1,32 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
 try:
     import geopandas as gpd
+    import shapely
+    from pyproj import Transformer
 except Exception:  # pragma: no cover
     gpd = None  # type: ignore
+    shapely = None  # type: ignore
+    Transformer = None  # type: ignore
 
 PathLike = Union[str, Path]
 
+# Masks with more features than this are queried through an STRtree over the
+# features instead of being unioned into one geometry first.
+_STRTREE_MIN_FEATURES = 8
+
+# read masks through pyogrio when available (see export._IO_ENGINE)
+_IO_ENGINE = "pyogrio" if find_spec("pyogrio") is not None else None
+
 
 def _require_geopandas() -> None:
     if gpd is None:
@@ -24,6 +38,58 @@ def _require_geopandas() -> None:
         )
 
 
+@lru_cache(maxsize=32)
+def _load_mask(path: str, mtime_ns: int) -> Tuple[Any, Any, Any]:
+    # Read + index a polygon mask once: (STRtree or None, prepared union or None, crs).
+    # Keyed on the file's mtime, so an edited mask is re-read; both None = empty mask.
+    # Masks are reused across many point tables (e.g. one monthly mask per batch).
+    gdf_poly = gpd.read_file(path, engine=_IO_ENGINE)
+    if gdf_poly.empty:
+        return None, None, gdf_poly.crs
+
+    if len(gdf_poly) > _STRTREE_MIN_FEATURES:
+        # many features: skip the (costly) union; the tree only tests nearby features
+        return shapely.STRtree(gdf_poly.geometry.values), None, gdf_poly.crs
+
+    # combine multi-features into one geometry
+    if hasattr(gdf_poly, "union_all"):
+        poly = gdf_poly.union_all()
+    else:
+        poly = gdf_poly.unary_union
+    shapely.prepare(poly)
+    return None, poly, gdf_poly.crs
+
+
+def _tree_mask(tree: Any, xs: np.ndarray, ys: np.ndarray, predicate: str) -> np.ndarray:
+    # Same answers as the prepared-union path (intersects_xy / contains_xy on the union),
+    # from per-feature tests: the tree only pairs points with nearby features.
+    pi, gi = tree.query(shapely.points(xs, ys), predicate="intersects")
+    m = np.zeros(len(xs), dtype=bool)
+    m[pi] = True
+    if predicate == "intersects":
+        return m
+
+    # within: a point inside some feature is inside the union ...
+    geoms = tree.geometries
+    inside = np.zeros(len(xs), dtype=bool)
+    inside[pi[shapely.contains_xy(geoms[gi], xs[pi], ys[pi])]] = True
+    # ... and so is a point on a border shared by several features (interior of their
+    # union); only the features touching the point decide that, so union just those
+    for p in np.flatnonzero(m & ~inside):
+        touching = gi[pi == p]
+        if len(touching) > 1:
+            inside[p] = shapely.contains_xy(shapely.union_all(geoms[touching]), xs[p], ys[p])
+    return inside
+
+
+@lru_cache(maxsize=32)
+def _transformer(points_crs: str, mask_crs: Any) -> Optional["Transformer"]:
+    # points CRS -> mask CRS (None when they already match); building one parses both CRSs
+    if mask_crs is None or points_crs is None or mask_crs == points_crs:
+        return None
+    return Transformer.from_crs(points_crs, mask_crs, always_xy=True)
+
+
 @dataclass(frozen=True)
 class VectorMaskSummary:
     mask_path: str
@@ -59,40 +125,36 @@ def filter_by_polygon(
         summary = VectorMaskSummary(str(p), 0, 0, 0.0)
         return df.copy(), summary
 
-    # points -> GeoDataFrame
-    gdf_pts = gpd.GeoDataFrame(
-        df.copy(),
-        geometry=gpd.points_from_xy(df[lon], df[lat]),
-        crs=points_crs,
-    )
+    if predicate not in ("within", "intersects"):
+        raise ValueError("predicate must be 'within' or 'intersects'")
 
-    # polygon -> GeoDataFrame
-    gdf_poly = gpd.read_file(p)
+    tree, poly, mask_crs = _load_mask(str(p.resolve()), p.stat().st_mtime_ns)
 
     # empty polygon: nothing passes (unless invert=True)
-    if gdf_poly.empty:
-        mask = [True] * len(gdf_pts) if invert else [False] * len(gdf_pts)
+    if tree is None and poly is None:
+        mask = np.full(len(df), invert)
     else:
-        # combine multi-features into one geometry
-        if hasattr(gdf_poly, "union_all"):
-            poly = gdf_poly.union_all()
-        else: 
-            poly = gdf_poly.unary_union
-
-        # align CRS if needed
-        if gdf_poly.crs is not None and gdf_pts.crs is not None and gdf_poly.crs != gdf_pts.crs:
-            gdf_pts = gdf_pts.to_crs(gdf_poly.crs)
-
-        if predicate == "within":
-            m = gdf_pts.geometry.within(poly)
-        elif predicate == "intersects":
-            m = gdf_pts.geometry.intersects(poly)
+        # Test raw coordinate arrays (no point GeoDataFrame): align CRS on the arrays,
+        # then vectorized GEOS calls.
+        # views of float64 columns (no copy); the transformer returns new arrays
+        xs = df[lon].to_numpy(dtype=np.float64, copy=False)
+        ys = df[lat].to_numpy(dtype=np.float64, copy=False)
+        transformer = _transformer(points_crs, mask_crs)
+        if transformer is not None:
+            xs, ys = transformer.transform(xs, ys)
+
+        if tree is not None:
+            m = _tree_mask(tree, xs, ys, predicate)
         else:
-            raise ValueError("predicate must be 'within' or 'intersects'")
+            if predicate == "within":
+                # point within polygon == polygon contains point
+                m = shapely.contains_xy(poly, xs, ys)
+            else:
+                m = shapely.intersects_xy(poly, xs, ys)
 
         mask = (~m) if invert else m
 
-    out = gdf_pts.loc[mask].drop(columns=["geometry"]).copy()
+    out = df.take(np.flatnonzero(mask))
 
     N_total = int(len(df))
     N_pass = int(len(out))
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import h5py
 import numpy as np
+import pandas as pd
+import pytest
 
-from atl08kit.atl08 import list_land_segment_fields, read_atl08_h5
+import atl08kit.atl08 as atl08
+from atl08kit.atl08 import list_land_segment_fields, read_atl08_h5, write_atl08_parquet
 
 
 def _make_mock_atl08_with_extra_fields(tmp_path: Path) -> Path:
@@ -59,4 +63,123 @@ def test_read_atl08_rejects_length_mismatch(tmp_path: Path):
         read_atl08_h5(h5, fields=["bad_len"])
         assert False, "Expected ValueError for length mismatch"
     except ValueError as e:
-        assert "length mismatch" in str(e)
\ No newline at end of file
+        assert "length mismatch" in str(e)
+
+
+def test_read_atl08_strict_fields_values(tmp_path: Path):
+    h5 = _make_mock_atl08_with_extra_fields(tmp_path)
+    df, s = read_atl08_h5(h5, fields=["dem_h", "terrain/h_te_best_fit"])
+
+    assert df["dem_h"].tolist() == [100.0, 101.0]
+    assert df["h_te_best_fit"].tolist() == [99.0, 80.0]
+    # on-disk dtype is preserved
+    assert df["dem_h"].dtype == np.float32
+    assert s.N_out == 2
+
+
+def test_read_atl08_multi_beam_order(tmp_path: Path):
+    h5 = _make_mock_atl08_with_extra_fields(tmp_path)
+    with h5py.File(h5, "a") as f:
+        ls = f.create_group("gt1l/land_segments")
+        ls.create_dataset("longitude", data=np.array([115.0], dtype=np.float64))
+        ls.create_dataset("latitude", data=np.array([28.0], dtype=np.float64))
+        ls.create_dataset("dem_h", data=np.array([90.0], dtype=np.float32))
+
+    df, s = read_atl08_h5(h5, fields=["dem_h"])
+
+    # rows follow beam order (gt1l before gt2l) regardless of read scheduling
+    assert df["beam"].tolist() == ["gt1l", "gt2l", "gt2l"]
+    assert isinstance(df["beam"].dtype, pd.CategoricalDtype)
+    assert df["source_file"].unique().tolist() == [h5.stem]
+    assert df["dem_h"].tolist() == [90.0, 100.0, 101.0]
+    assert s.N_total == 3
+
+
+def test_write_atl08_parquet_matches_read(tmp_path: Path):
+    pytest.importorskip("pyarrow")
+
+    h5 = _make_mock_atl08_with_extra_fields(tmp_path)
+    out = tmp_path / "points.parquet"
+
+    s = write_atl08_parquet(h5, out, fields=["dem_h", "terrain/h_te_best_fit"])
+    df_mem, _ = read_atl08_h5(h5, fields=["dem_h", "terrain/h_te_best_fit"])
+    df_pq = pd.read_parquet(out)
+
+    assert s.N_out == 2
+    assert df_pq.columns.tolist() == df_mem.columns.tolist()
+    assert df_pq["dem_h"].tolist() == df_mem["dem_h"].tolist()
+    assert df_pq["beam"].astype(str).tolist() == ["gt2l", "gt2l"]
+
+
+def test_read_atl08_auto_skips_without_reading(tmp_path: Path, monkeypatch):
+    h5 = _make_mock_atl08_with_extra_fields(tmp_path)
+
+    read_names: list[str] = []
+    orig = atl08._read_dataset
+
+    def spy(dset):
+        read_names.append(dset.name)
+        return orig(dset)
+
+    monkeypatch.setattr(atl08, "_read_dataset", spy)
+
+    df, s = read_atl08_h5(h5)
+
+    assert "bad_2d" in s.fields_skipped
+    assert "bad_len" in s.fields_skipped
+    assert "terrain/h_te_best_fit" in s.fields_used
+    assert "terrain_h_te_best_fit" in df.columns
+    # misaligned datasets are rejected from shape metadata, never read
+    assert not any(n.endswith(("bad_2d", "bad_len")) for n in read_names)
+
+
+def test_list_land_segment_fields_sees_rewrites(tmp_path: Path):
+    h5 = _make_mock_atl08_with_extra_fields(tmp_path)
+    first = list_land_segment_fields(h5, beam="gt2l")
+    assert "new_field" not in first
+
+    with h5py.File(h5, "a") as f:
+        f["gt2l/land_segments"].create_dataset("new_field", data=np.array([1, 2]))
+    st = h5.stat()
+    os.utime(h5, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    assert "new_field" in list_land_segment_fields(h5, beam="gt2l")
+    # callers get their own list (cached result is not shared mutable state)
+    first.clear()
+    assert list_land_segment_fields(h5, beam="gt2l")
+
+
+def test_read_atl08_pyarrow_backend(tmp_path: Path):
+    pytest.importorskip("pyarrow")
+    from atl08kit.filters import filter_by_expr
+
+    h5 = _make_mock_atl08_with_extra_fields(tmp_path)
+    df, _ = read_atl08_h5(h5, fields=["dem_h", "terrain/h_te_best_fit"], dtype_backend="pyarrow")
+
+    assert all(isinstance(t, pd.ArrowDtype) for t in df.dtypes)
+    assert df["beam"].astype(str).tolist() == ["gt2l", "gt2l"]
+
+    out, summary = filter_by_expr(df, "abs(dem_h - h_te_best_fit) <= 3")
+    assert summary["N_pass"] == 1
+    assert out["dem_h"].tolist() == [100.0]
+
+
+def test_read_dataset_contiguous_and_chunked_agree(tmp_path: Path):
+    h5 = tmp_path / "layouts.h5"
+    values = np.linspace(0.0, 1.0, 1000, dtype=np.float32)
+    with h5py.File(h5, "w") as f:
+        f.create_dataset("contig", data=values)
+        f.create_dataset("chunked", data=values, chunks=(100,), compression="gzip")
+
+    with h5py.File(h5, "r") as f:
+        assert atl08._memmap_offset(f["contig"]) is not None
+        assert atl08._memmap_offset(f["chunked"]) is None
+
+        a = atl08._read_dataset(f["contig"])
+        b = atl08._read_dataset(f["chunked"])
+
+    # plain ndarray copies, not views over the mapped file
+    assert type(a) is np.ndarray
+    assert a.dtype == np.float32
+    np.testing.assert_array_equal(a, values)
+    np.testing.assert_array_equal(b, values)
@@ -1,4 +1,6 @@
 import numpy as np
+import pandas as pd
+
 import atl08kit.beams as beams
 
 
@@ -28,4 +30,90 @@ def test_get_strong_beams_from_h5(monkeypatch, tmp_path):
     fake_h5.touch()
 
     strong = beams.get_strong_beams_from_h5(fake_h5)
-    assert strong == ["gt1r", "gt2r", "gt3r"]
\ No newline at end of file
+    assert strong == ["gt1r", "gt2r", "gt3r"]
+
+
+def test_filter_strong_beams():
+    df = pd.DataFrame(
+        {
+            "beam": ["gt1l", "gt1r", "gt2l", "gt2r", "gt1l"],
+            "source_file": [
+                "ATL08_A",
+                "ATL08_A",
+                "ATL08_B_Rule3_full.csv",
+                "ATL08_B_Rule3_full.csv",
+                "ATL08_unknown",
+            ],
+            "v": [1, 2, 3, 4, 5],
+        }
+    )
+    strong_map = {"ATL08_A": ["gt1l", "gt2l", "gt3l"], "ATL08_B": ["gt1r", "gt2r", "gt3r"]}
+
+    out, summary = beams.filter_strong_beams(df, strong_map)
+    assert out["v"].tolist() == [1, 4]
+    assert summary["N_total"] == 5
+    assert summary["N_pass"] == 2
+
+
+def test_norm_src_name():
+    names = [
+        "ATL08_20220102113835_01711406_007_01",
+        "ATL08_20220102113835_01711406_007_01.h5",
+        "out/ATL08_20220102113835_01711406_007_01_Rule3_full.csv",
+        "ATL08_20220102113835_01711406_007_01_raw_allpoints.csv",
+        "ATL08_20220102113835_01711406_007_01_raw_allpoints_Rule8_full.csv",
+        # stacked suffixes are all stripped
+        "ATL08_20220102113835_01711406_007_01_Rule1_full_Rule2_full.csv",
+        "ATL08_20220102113835_01711406_007_01_Rule2_full_Rule1_full",
+        "ATL08_20220102113835_01711406_007_01_Rule3_full_raw_allpoints_Rule4_full",
+        "ATL08_20220102113835_01711406_007_01_Rule9_full_raw_allpoints",
+    ]
+    expected = [beams.norm_src_name(x) for x in names]
+
+    assert set(expected[:-1]) == {"ATL08_20220102113835_01711406_007_01"}
+    assert expected[-1] == "ATL08_20220102113835_01711406_007_01_Rule9_full"
+
+
+def test_build_strong_beam_map(tmp_path):
+    import h5py
+
+    for i, orient in enumerate([0, 1, 0]):
+        with h5py.File(tmp_path / f"ATL08_2022010{i}_x.h5", "w") as f:
+            f.create_dataset("/orbit_info/sc_orient", data=np.array([orient]))
+    (tmp_path / "other.h5").touch()
+
+    strong_map = beams.build_strong_beam_map(tmp_path)
+    assert list(strong_map) == ["ATL08_20220100_x", "ATL08_20220101_x", "ATL08_20220102_x"]
+    assert strong_map["ATL08_20220101_x"] == ["gt1r", "gt2r", "gt3r"]
+    assert beams.build_strong_beam_map(tmp_path / "missing") == {}
+
+
+def test_filter_strong_beams_categorical_columns():
+    # read_atl08_h5 produces categorical beam/source_file columns
+    df = pd.DataFrame(
+        {
+            "beam": pd.Categorical(["gt1l", "gt1r", "gt2l"], categories=["gt1l", "gt1r", "gt2l", "gt2r"]),
+            "source_file": pd.Categorical(["ATL08_A"] * 3),
+        }
+    )
+    out, summary = beams.filter_strong_beams(df, {"ATL08_A": ["gt1l", "gt2l", "gt3l"]})
+    assert out["beam"].astype(str).tolist() == ["gt1l", "gt2l"]
+    assert summary["N_pass"] == 2
+
+
+def test_filter_strong_beams_normalizes_once_per_source():
+    calls = []
+
+    def normalize(s):
+        calls.append(s)
+        return beams.norm_src_name(s)
+
+    src = ["ATL08_A_Rule3_full.csv", "ATL08_B_raw_allpoints.csv"] * 50
+    df = pd.DataFrame({"beam": ["gt1l", "gt1r"] * 50, "source_file": src})
+    strong_map = {"ATL08_A": ["gt1l"], "ATL08_B": ["gt1r"]}
+
+    for col in (df["source_file"], df["source_file"].astype("category")):
+        calls.clear()
+        out, summary = beams.filter_strong_beams(df.assign(source_file=col), strong_map, normalize=normalize)
+        assert sorted(calls) == sorted(set(src))
+        assert summary["N_pass"] == 100
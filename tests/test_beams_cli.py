@@ -0,0 +1,50 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import h5py
+import numpy as np
+import pandas as pd
+
+
+def _write_orbit_h5(path: Path, sc_orient: int):
+    with h5py.File(path, "w") as f:
+        f.create_dataset("/orbit_info/sc_orient", data=np.array([sc_orient], dtype=np.int32))
+
+
+def test_cli_beams_strong_only(tmp_path: Path):
+    h5_dir = tmp_path / "h5"
+    h5_dir.mkdir()
+    _write_orbit_h5(h5_dir / "ATL08_20220102113835_01711406_007_01.h5", 0)  # left strong
+    _write_orbit_h5(h5_dir / "ATL08_20220203113835_01711406_007_01.h5", 1)  # right strong
+
+    df = pd.DataFrame(
+        {
+            "beam": ["gt1l", "gt1r", "gt2l", "gt2r"],
+            "source_file": [
+                "ATL08_20220102113835_01711406_007_01",
+                "ATL08_20220102113835_01711406_007_01",
+                "out/ATL08_20220203113835_01711406_007_01_Rule1_full.csv",
+                "out/ATL08_20220203113835_01711406_007_01_Rule1_full.csv",
+            ],
+            "pid": [1, 2, 3, 4],
+        }
+    )
+    in_csv = tmp_path / "in.csv"
+    out_csv = tmp_path / "out.csv"
+    df.to_csv(in_csv, index=False)
+
+    cmd = [
+        sys.executable, "-m", "atl08kit.cli",
+        "beams",
+        "--in", str(in_csv),
+        "--out", str(out_csv),
+        "--h5-folder", str(h5_dir),
+        "--summary",
+    ]
+    res = subprocess.run(cmd, cwd=str(tmp_path), text=True, capture_output=True)
+    assert res.returncode == 0, f"STDOUT:\n{res.stdout}\nSTDERR:\n{res.stderr}"
+
+    out = pd.read_csv(out_csv)
+    assert out["pid"].tolist() == [1, 4]
+    assert "N_pass=2" in res.stdout
@@ -48,4 +48,91 @@ def test_cli_filter_expr(tmp_path: Path):
     assert out_csv.exists()
 
     out_df = pd.read_csv(out_csv)
-    assert len(out_df) == 1
\ No newline at end of file
+    assert len(out_df) == 1
+
+
+def test_atl08_stem_matches_regex():
+    import re
+
+    from atl08kit.cli import _norm_src_to_atl08_stem
+
+    ref = re.compile(r"(ATL08_\d{14}_\d+_\d+_\d+)", re.IGNORECASE)
+    cases = [
+        "/data/ATL08_20200101123456_01230601_006_01.h5",
+        "ATL08_20200101123456_01230601_006_01_raw_allpoints.csv",
+        "x/atl08_20200101123456_1_2_3_Rule2_full",
+        "ATL08_2020_bad/ATL08_20200101123456_1_2_3.h5",
+        "ATL08_20200101123456_1_2.h5",
+        "straße/ATL08_20200101123456_1_2_3",
+        "plain_name.h5",
+    ]
+    for s in cases:
+        m = ref.search(s)
+        expected = m.group(1) if m else Path(s).stem
+        assert _norm_src_to_atl08_stem(s) == expected, s
+
+
+def test_cli_filter_keep_cols(tmp_path: Path):
+    df = pd.DataFrame({"lon": [1.0, 2.0], "lat": [3.0, 4.0], "cloud_flag_atm": [0, 5], "extra": ["a", "b"]})
+    in_csv = tmp_path / "in.csv"
+    out_csv = tmp_path / "out.csv"
+    df.to_csv(in_csv, index=False)
+
+    cmd = [
+        sys.executable,
+        "-m",
+        "atl08kit.cli",
+        "filter",
+        "--in",
+        str(in_csv),
+        "--out",
+        str(out_csv),
+        "--expr",
+        "cloud_flag_atm < 3",
+        "--keep-cols",
+        "lat",
+        "lon",
+    ]
+    res = run_cmd(cmd, cwd=tmp_path)
+    assert res.returncode == 0, f"STDOUT:\n{res.stdout}\nSTDERR:\n{res.stderr}"
+
+    out_df = pd.read_csv(out_csv)
+    assert out_df.columns.tolist() == ["lon", "lat"]
+    assert out_df["lon"].tolist() == [1.0]
+
+
+def test_cli_filter_chunksize_streams(tmp_path: Path):
+    df = pd.DataFrame({"a": range(25), "b": [x % 3 for x in range(25)]})
+    in_csv = tmp_path / "in.csv"
+    out_csv = tmp_path / "out.csv"
+    df.to_csv(in_csv, index=False)
+
+    cmd = [
+        sys.executable,
+        "-m",
+        "atl08kit.cli",
+        "filter",
+        "--in",
+        str(in_csv),
+        "--out",
+        str(out_csv),
+        "--expr",
+        "b == 0",
+        "--chunksize",
+        "4",
+        "--summary",
+    ]
+    res = run_cmd(cmd, cwd=tmp_path)
+    assert res.returncode == 0, f"STDOUT:\n{res.stdout}\nSTDERR:\n{res.stderr}"
+    assert "N_total=25 N_pass=9" in res.stdout
+
+    out_df = pd.read_csv(out_csv)
+    assert out_df["a"].tolist() == list(range(0, 25, 3))
+
+
+def test_cli_import_is_lightweight():
+    # heavy deps load per command, not when the CLI module is imported
+    code = "import sys, atl08kit.cli; print(sorted(m for m in ('h5py', 'pandas', 'rasterio', 'geopandas') if m in sys.modules))"
+    res = subprocess.run([sys.executable, "-c", code], text=True, capture_output=True)
+    assert res.returncode == 0, res.stderr
+    assert res.stdout.strip() == "[]"
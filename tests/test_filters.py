@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -41,4 +42,216 @@ def test_disallowed_function_raises():
 def test_expression_must_be_boolean():
     df = make_df()
     with pytest.raises(ExprError):
-        filter_by_expr(df, "dem_h - h_te_best_fit")
\ No newline at end of file
+        filter_by_expr(df, "dem_h - h_te_best_fit")
+
+
+def test_chained_comparison_and_not():
+    df = make_df()
+    out, _ = filter_by_expr(df, "90 < h_te_best_fit <= 98 and not terrain_flg == 1")
+    assert out["h_te_best_fit"].tolist() == [98.0]
+
+
+def test_string_constant_rejected():
+    df = make_df()
+    with pytest.raises(ExprError):
+        filter_by_expr(df, "dem_h == 'x'")
+
+
+def test_numexpr_engine_matches_python():
+    pytest.importorskip("numexpr")
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "dem_h": rng.normal(100, 5, 1000),
+            "h_te_best_fit": rng.normal(100, 5, 1000),
+            "cloud_flag_atm": rng.integers(0, 6, 1000),
+        }
+    )
+    expr = "abs(dem_h - h_te_best_fit) <= 3 and not cloud_flag_atm >= 3 or 0 < cloud_flag_atm < 2"
+
+    out_py, s_py = filter_by_expr(df, expr, engine="python")
+    out_ne, s_ne = filter_by_expr(df, expr, engine="numexpr")
+    assert s_py["N_pass"] == s_ne["N_pass"]
+    assert out_py.index.tolist() == out_ne.index.tolist()
+
+
+def test_downcast_keeps_output_dtypes():
+    df = make_df()
+    out, summary = filter_by_expr(df, "abs(dem_h - h_te_best_fit) <= 3", downcast=True)
+    assert summary["N_pass"] == 2
+    assert out["dem_h"].dtype == df["dem_h"].dtype
+
+
+def test_short_circuit_and_matches_full_eval():
+    import numpy as np
+
+    rng = np.random.default_rng(1)
+    n = 50_000
+    df = pd.DataFrame(
+        {
+            "cloud_flag_atm": rng.integers(0, 20, n),  # first term keeps ~5%
+            "dem_h": rng.normal(100, 5, n),
+            "h_te_best_fit": rng.normal(100, 5, n),
+            "terrain_flg": rng.integers(0, 2, n),
+        }
+    )
+    expr = "cloud_flag_atm < 1 and abs(dem_h - h_te_best_fit) <= 3 and 0 <= terrain_flg < 1"
+
+    out, summary = filter_by_expr(df, expr, engine="python")
+    expected = (
+        (df["cloud_flag_atm"] < 1)
+        & ((df["dem_h"] - df["h_te_best_fit"]).abs() <= 3)
+        & (df["terrain_flg"] == 0)
+    )
+    assert summary["N_pass"] == int(expected.sum())
+    assert out.index.tolist() == df.index[expected].tolist()
+
+
+def test_iter_filter_matches_filter_by_expr():
+    from atl08kit.filters import iter_filter
+
+    df = pd.DataFrame({"a": np.arange(10), "b": np.arange(10)[::-1]})
+    expr = "a > 2 and b > 2"
+    chunks = [df.iloc[i : i + 3] for i in range(0, len(df), 3)]
+
+    parts = list(iter_filter(chunks, expr))
+    out = pd.concat([p for p, _ in parts])
+    ref, summary = filter_by_expr(df, expr)
+    assert out["a"].tolist() == ref["a"].tolist()
+    assert sum(s["N_pass"] for _, s in parts) == summary["N_pass"]
+    assert sum(s["N_total"] for _, s in parts) == 10
+
+
+def test_eval_expr_returns_bool_ndarray():
+    from atl08kit.expr import compile_expr, eval_expr
+
+    df = pd.DataFrame({"a": [1.0, None, 3.0]}, index=[10, 20, 30])
+    mask = eval_expr(compile_expr("a > 1"), df)
+    assert isinstance(mask, np.ndarray) and mask.dtype == bool
+    assert mask.tolist() == [False, False, True]
+
+    # nullable input: missing compares as False
+    mask = eval_expr(compile_expr("a > 1"), df.convert_dtypes())
+    assert mask.tolist() == [False, False, True]
+
+
+def test_repeated_subexpression_shared():
+    from atl08kit.expr import compile_expr
+
+    expr = "abs(a - b) <= 3 and abs(a - b) > 0 or (a - b) > 8"
+    compiled = compile_expr(expr)
+    # abs(a - b) and a - b are each computed once
+    assert sum(n.startswith("_atl08kit_cse") for n in compiled.code.co_names) == 2
+
+    df = pd.DataFrame({"a": np.arange(12.0), "b": np.full(12, 2.0)})
+    ref = df[((df.a - df.b).abs() <= 3) & ((df.a - df.b).abs() > 0) | ((df.a - df.b) > 8)]
+    out, _ = filter_by_expr(df, expr, engine="python")
+    assert out["a"].tolist() == ref["a"].tolist()
+
+
+def test_reserved_names_rejected():
+    with pytest.raises(ExprError):
+        filter_by_expr(pd.DataFrame({"_atl08kit_cse0": [1]}), "_atl08kit_cse0 > 0")
+
+
+def test_precompiled_expr_reused_and_picklable():
+    import pickle
+
+    from atl08kit.expr import compile_expr
+
+    compiled = compile_expr("abs(dem_h - h_te_best_fit) <= 3")
+    out, summary = filter_by_expr(make_df(), compiled)
+    assert summary["expr"] == compiled.expr
+    assert len(out) == 2
+
+    clone = pickle.loads(pickle.dumps(compiled))
+    assert clone.expr == compiled.expr and clone.names == compiled.names
+
+
+def test_hot_kernel_matches_python_engine():
+    pytest.importorskip("numba")
+    from atl08kit.expr import _KERNEL_MIN_ROWS, _run_kernel, compile_expr, eval_expr
+
+    rng = np.random.default_rng(0)
+    n = _KERNEL_MIN_ROWS + 7
+    df = pd.DataFrame({"dem_h": rng.normal(100, 5, n), "h_te_best_fit": rng.normal(100, 5, n)})
+    df.loc[::5, "h_te_best_fit"] = np.nan
+
+    compiled = compile_expr("abs(dem_h - h_te_best_fit) <= 3")
+    assert compiled.kernel is not None
+    for downcast in (False, True):
+        fast = eval_expr(compiled, df, downcast=downcast)
+        ref = eval_expr(compiled, df, engine="python", downcast=downcast)
+        assert np.array_equal(fast, ref)
+
+    # int8 columns: NumPy computes 127 - (-128) at int8 (wraps to -1), numba in int64
+    # -> the kernel declines and the generic path answers
+    df8 = pd.DataFrame({"dem_h": np.full(3, 127, dtype=np.int8), "h_te_best_fit": np.full(3, -128, dtype=np.int8)})
+    assert _run_kernel(compiled.kernel, {c: df8[c] for c in df8}) is None
+
+
+def test_fused_kernel_matches_python_engine():
+    pytest.importorskip("numba")
+    from atl08kit.expr import compile_expr, eval_expr
+
+    rng = np.random.default_rng(1)
+    n = 2_000
+    df = pd.DataFrame({"a": rng.normal(0, 5, n), "b": rng.normal(0, 5, n), "k": rng.integers(-3, 4, n)})
+    df.loc[::7, "a"] = np.nan
+
+    for expr in (
+        "abs(a - b) <= 3 and k < 3",
+        "not (a > 1 or b / k < 0.5)",
+        "-3 < a - b <= 2 * k",
+    ):
+        compiled = compile_expr(expr)
+        assert compiled.kernel[0] == "fused", expr
+        ref = eval_expr(compiled, df, engine="python")
+        assert np.array_equal(eval_expr(compiled, df, engine="numba"), ref), expr
+        # float32 columns are not fused (different promotion) -> interpreted fallback
+        ref32 = eval_expr(compiled, df, engine="python", downcast=True)
+        assert np.array_equal(eval_expr(compiled, df, engine="numba", downcast=True), ref32), expr
+
+    assert compile_expr("a ** 2 < 3").kernel is None
+    out, _ = filter_by_expr(df, "a ** 2 < 3", engine="numba")
+    assert len(out) == int((df["a"] ** 2 < 3).sum())
+
+
+def test_fused_kernel_narrow_ints_match_python_engine():
+    pytest.importorskip("numba")
+    from atl08kit.expr import compile_expr, eval_expr
+
+    # int8 flag columns (extract Parquet, --compact-dtypes): NumPy wraps at int8
+    df = pd.DataFrame({"a": np.array([100, 1, -100], dtype=np.int8), "b": np.array([100, 2, -100], dtype=np.int8)})
+    for expr in ("a + b > 150", "a * 2 > 150", "a - b < -150"):
+        compiled = compile_expr(expr)
+        assert compiled.kernel[0] == "fused", expr
+        ref = eval_expr(compiled, df, engine="python")
+        assert np.array_equal(eval_expr(compiled, df, engine="numba"), ref), expr
+
+
+def test_auto_engine_narrow_ints_independent_of_frame_size():
+    from atl08kit.expr import _NUMEXPR_MIN_ROWS
+
+    # int8 flags wrap in NumPy (100 + 100 -> -56); large frames must not switch semantics
+    small = pd.DataFrame({"f": np.full(10, 100, dtype=np.int8)})
+    large = pd.DataFrame({"f": np.full(_NUMEXPR_MIN_ROWS, 100, dtype=np.int8)})
+    _, s_small = filter_by_expr(small, "f + f > 150")
+    _, s_large = filter_by_expr(large, "f + f > 150")
+    assert s_small["pass_rate"] == s_large["pass_rate"]
+
+
+def test_and_with_non_comparison_term_independent_of_frame_size():
+    from atl08kit.expr import _SHORT_CIRCUIT_MIN_ROWS
+
+    # "k" is an int column: the and becomes a bitwise & over the whole expression
+    n = _SHORT_CIRCUIT_MIN_ROWS * 2
+    df = pd.DataFrame({"a": np.arange(n) % 3, "k": np.arange(n) % 2})
+    expected = int(((df["a"] > 0) & df["k"]).astype(bool).sum())
+    for engine in ("python", "auto"):
+        out, _ = filter_by_expr(df, "a > 0 and k", engine=engine)
+        small, _ = filter_by_expr(df.head(20), "a > 0 and k", engine=engine)
+        assert len(out) == expected
+        assert small.index.tolist() == out.index[out.index < 20].tolist()
@@ -2,7 +2,7 @@ from pathlib import Path
 import pandas as pd
 import pytest
 
-from atl08kit.io import read_table, write_table
+from atl08kit.io import list_files, read_table, write_table
 
 
 def test_io_read_write_csv(tmp_path: Path):
@@ -18,4 +18,115 @@ def test_io_read_write_csv(tmp_path: Path):
 def test_io_unsupported_format(tmp_path: Path):
     df = pd.DataFrame({"a": [1]})
     with pytest.raises(ValueError):
-        write_table(df, tmp_path / "x.parquet")
\ No newline at end of file
+        write_table(df, tmp_path / "x.xlsx")
+
+
+def test_list_files_sorted_and_filtered(tmp_path: Path):
+    for name in ["b.csv", "a.csv", "c.txt"]:
+        (tmp_path / name).write_text("x\n1\n")
+    (tmp_path / "d.csv").mkdir()  # directories never match
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "e.csv").write_text("x\n1\n")
+
+    assert [p.name for p in list_files(tmp_path, "*.csv")] == ["a.csv", "b.csv"]
+    assert [p.name for p in list_files(tmp_path, "sub/*.csv")] == ["e.csv"]
+    assert list_files(tmp_path / "missing", "*.csv") == []
+
+
+@pytest.mark.parametrize("csv_engine", ["c", "pyarrow"])
+def test_read_table_column_projection(tmp_path: Path, csv_engine: str):
+    df = pd.DataFrame({"a": [1, 2], "b": [3, 4], "c": [5, 6]})
+    write_table(df, tmp_path / "x.csv")
+
+    df2 = read_table(tmp_path / "x.csv", columns=["c", "a"], csv_engine=csv_engine)
+    assert df2.columns.tolist() == ["a", "c"]
+
+    pytest.importorskip("pyarrow")
+    df.to_parquet(tmp_path / "x.parquet", index=False)
+    df3 = read_table(tmp_path / "x.parquet", columns=["b"])
+    assert df3["b"].tolist() == [3, 4]
+    assert read_table(tmp_path / "x.parquet").shape == (2, 3)
+
+
+@pytest.mark.parametrize("csv_engine", ["c", "pyarrow"])
+def test_read_table_keeps_timestamp_text(tmp_path: Path, csv_engine: str):
+    p = tmp_path / "t.csv"
+    p.write_text("t,x\n2020-01-01T10:00:00,1\n2020-01-02T11:30:00,2\n")
+
+    df = read_table(p, csv_engine=csv_engine)
+    write_table(df, tmp_path / "out.csv")
+    assert (tmp_path / "out.csv").read_text() == p.read_text()
+
+
+@pytest.mark.parametrize("csv_engine", ["c", "pyarrow"])
+def test_read_table_csv_missing_cells(tmp_path: Path, csv_engine: str):
+    from atl08kit.io import iter_table
+
+    # empty, "None" and "<NA>" cells are missing values, as in pd.read_csv
+    p = tmp_path / "na.csv"
+    p.write_text("a,s,t,n\n1,x,None,1\n2,,y,<NA>\n3,z,<NA>,3\n")
+
+    df = read_table(p, csv_engine=csv_engine)
+    assert int(df.isna().sum().sum()) == 4
+    assert df["n"].dtype == "float64"
+    # same cells missing with and without chunking
+    chunked = pd.concat(list(iter_table(p, chunksize=2)))
+    assert chunked.isna().values.tolist() == df.isna().values.tolist()
+
+
+def test_read_table_csv_duplicate_header(tmp_path: Path):
+    p = tmp_path / "dup.csv"
+    p.write_text("a,a,b\n1,2,3\n")
+    for csv_engine in ("c", "pyarrow"):
+        assert read_table(p, csv_engine=csv_engine).columns.tolist() == ["a", "a.1", "b"]
+    with pytest.raises(ValueError):
+        read_table(p, csv_engine="arrow")
+
+
+@pytest.mark.parametrize("ext", [".parquet", ".feather"])
+def test_io_columnar_round_trip(tmp_path: Path, ext: str):
+    pytest.importorskip("pyarrow")
+    from atl08kit.io import iter_table
+
+    df = pd.DataFrame({"a": [1, 2, 3], "b": [0.5, 1.5, 2.5], "beam": ["gt1l", "gt2r", "gt3l"]}).iloc[[0, 2]]
+    out = tmp_path / f"x{ext}"
+    write_table(df, out)
+
+    back = read_table(out)
+    assert back["a"].tolist() == [1, 3]
+    assert back["b"].dtype == "float64"
+    assert read_table(out, columns=["beam"]).columns.tolist() == ["beam"]
+    assert [len(c) for c in iter_table(out, chunksize=1)] == [1, 1]
+
+
+def test_read_table_downcast(tmp_path: Path):
+    df = pd.DataFrame(
+        {
+            "cloud_flag_atm": [0, 5, 1, 0, 0, 1],
+            "h": [1.5, 2.5, 3.5, 4.5, 5.5, 6.5],
+            "beam": ["gt1l", "gt1l", "gt2r", "gt1l", "gt2r", "gt2r"],
+            "id": ["a", "b", "c", "d", "e", "f"],
+        }
+    )
+    write_table(df, tmp_path / "x.csv")
+
+    out = read_table(tmp_path / "x.csv", downcast=True)
+    assert out["cloud_flag_atm"].dtype == "int8"
+    assert out["h"].dtype == "float64"
+    assert isinstance(out["beam"].dtype, pd.CategoricalDtype)
+    assert not isinstance(out["id"].dtype, pd.CategoricalDtype)  # all distinct
+    assert out["beam"].astype(str).tolist() == df["beam"].tolist()
+
+
+def test_write_table_chunks_no_chunks(tmp_path: Path):
+    from atl08kit.io import write_table_chunks
+
+    out = tmp_path / "empty.csv"
+    assert write_table_chunks(iter([]), out, columns=["a", "b"]) == 0
+    back = read_table(out)
+    assert back.columns.tolist() == ["a", "b"] and back.empty
+
+    # without a schema there is no header to write: no (unreadable) zero-byte file
+    missing = tmp_path / "none.csv"
+    assert write_table_chunks(iter([]), missing) == 0
+    assert not missing.exists()
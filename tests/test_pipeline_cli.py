@@ -1,3 +1,4 @@
+import os
 import subprocess
 import sys
 from pathlib import Path
@@ -38,4 +39,68 @@ def test_cli_run_pipeline_expr_only(tmp_path: Path):
 
     assert out_csv.exists()
     out_df = pd.read_csv(out_csv)
-    assert len(out_df) == 1
\ No newline at end of file
+    assert len(out_df) == 1
+
+
+def test_cli_run_pipeline_strong_beams(tmp_path: Path):
+    import h5py
+    import numpy as np
+
+    h5_dir = tmp_path / "h5"
+    h5_dir.mkdir()
+    with h5py.File(h5_dir / "ATL08_20220102113835_01711406_007_01.h5", "w") as f:
+        f.create_dataset("/orbit_info/sc_orient", data=np.array([1], dtype=np.int32))  # right strong
+
+    df = pd.DataFrame(
+        {
+            "beam": ["gt1l", "gt1r", "gt2r", "gt3r"],
+            "source_file": ["ATL08_20220102113835_01711406_007_01_raw_allpoints"] * 3 + ["ATL08_other"],
+            "cloud_flag_atm": [0, 0, 5, 0],
+        }
+    )
+    in_csv = tmp_path / "in.csv"
+    out_csv = tmp_path / "out.csv"
+    df.to_csv(in_csv, index=False)
+
+    cmd = [
+        sys.executable, "-m", "atl08kit.cli",
+        "run",
+        "--in", str(in_csv),
+        "--out", str(out_csv),
+        "--h5-folder", str(h5_dir),
+        "--expr", "cloud_flag_atm < 3",
+        "--summary",
+    ]
+    res = subprocess.run(cmd, cwd=str(tmp_path), text=True, capture_output=True)
+    assert res.returncode == 0, f"STDOUT:\n{res.stdout}\nSTDERR:\n{res.stderr}"
+    assert "N_after_beams=2" in res.stdout
+
+    out_df = pd.read_csv(out_csv)
+    assert out_df["beam"].tolist() == ["gt1r"]
+
+
+def test_apply_strong_beams_caches_folder_scan(tmp_path: Path, monkeypatch):
+    from atl08kit import pipeline
+
+    calls = []
+
+    def fake_build(folder):
+        calls.append(folder)
+        return {"ATL08_A": ["gt1l", "gt2l", "gt3l"]}
+
+    monkeypatch.setattr(pipeline, "build_strong_beam_map", fake_build)
+    pipeline._cached_strong_beam_map.cache_clear()
+
+    df = pd.DataFrame({"beam": ["gt1l", "gt1r"], "source_file": ["ATL08_A", "ATL08_A"]})
+    for _ in range(3):
+        out, summary = pipeline.apply_strong_beams(df, tmp_path)
+        assert out["beam"].tolist() == ["gt1l"]
+    assert len(calls) == 1
+
+    # a new file in the folder bumps its mtime -> rescan
+    (tmp_path / "ATL08_new.h5").touch()
+    st = tmp_path.stat()
+    os.utime(tmp_path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    pipeline.apply_strong_beams(df, tmp_path)
+    assert len(calls) == 2
+    pipeline._cached_strong_beam_map.cache_clear()
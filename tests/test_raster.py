@@ -53,6 +53,7 @@ def test_add_raster_column_and_filter(tmp_path: Path):
 
     df2, _ = add_raster_column(df, tif, out_col="mask", lon="lon", lat="lat")
     assert "mask" in df2.columns
+    assert "mask" not in df.columns  # shallow copy, input untouched
     assert df2["mask"].tolist() == [2.0, 1.0, 2.0, 0.0]
 
     # Keep only value 2
@@ -60,4 +61,87 @@ def test_add_raster_column_and_filter(tmp_path: Path):
     assert len(out) == 2
     assert out["id"].tolist() == [1, 3]
     assert summary["N_total"] == 4
-    assert summary["N_pass"] == 2
\ No newline at end of file
+    assert summary["N_pass"] == 2
+
+
+def test_filter_by_raster_drop_values_and_nodata(tmp_path: Path):
+    tif = tmp_path / "mask.tif"
+    _write_tiny_tif(tif)
+
+    # last point falls outside the raster -> nodata
+    df = pd.DataFrame({"lon": [0.5, 1.5, 1.5, 5.0], "lat": [1.5, 1.5, 0.5, 5.0], "id": [1, 2, 4, 9]})
+
+    out, _ = filter_by_raster(df, tif, drop_values=[0], lon="lon", lat="lat")
+    assert out["id"].tolist() == [1, 2]
+
+    out, summary = filter_by_raster(df, tif, drop_values=[0], keep_nodata=True, lon="lon", lat="lat")
+    assert out["id"].tolist() == [1, 2, 9]
+    assert summary["N_nodata"] == 1
+
+    # keep_values never keeps nodata, even with keep_nodata=True
+    out, _ = filter_by_raster(df, tif, keep_values=[2], keep_nodata=True, lon="lon", lat="lat")
+    assert out["id"].tolist() == [1]
+
+
+def test_sample_raster_block_reads_match_window(tmp_path: Path, monkeypatch):
+    rasterio = pytest.importorskip("rasterio")
+    from rasterio.transform import from_origin
+
+    from atl08kit import raster
+
+    tif = tmp_path / "tiled.tif"
+    data = np.arange(64 * 48, dtype=np.float32).reshape(64, 48)
+    profile = {
+        "driver": "GTiff", "height": 64, "width": 48, "count": 1, "dtype": "float32",
+        "crs": "EPSG:4326", "transform": from_origin(0, 64, 1, 1),
+        "tiled": True, "blockxsize": 16, "blockysize": 16,
+    }
+    with rasterio.open(tif, "w", **profile) as dst:
+        dst.write(data, 1)
+
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame({"lon": rng.uniform(-2, 50, 200), "lat": rng.uniform(-2, 66, 200)})
+    df.loc[0, "lon"] = np.nan
+
+    with rasterio.open(tif) as src:
+        ref = np.array([s[0] for s in src.sample(list(zip(df["lon"].fillna(-1), df["lat"])), indexes=1)], dtype=float)
+
+    window_vals, _ = raster.sample_raster(df, tif)
+    monkeypatch.setattr(raster, "_MAX_WINDOW_CELLS", 16)
+    block_vals, _ = raster.sample_raster(df, tif)
+    np.testing.assert_array_equal(window_vals, ref)
+    np.testing.assert_array_equal(block_vals, ref)
+
+
+def test_sample_raster_far_apart_points_read_blocks(tmp_path: Path, monkeypatch):
+    rasterio = pytest.importorskip("rasterio")
+    from rasterio.transform import from_origin
+
+    from atl08kit import raster
+
+    tif = tmp_path / "big.tif"
+    data = np.arange(1024 * 1024, dtype=np.float32).reshape(1024, 1024)
+    profile = {
+        "driver": "GTiff", "height": 1024, "width": 1024, "count": 1, "dtype": "float32",
+        "crs": "EPSG:4326", "transform": from_origin(0, 1024, 1, 1),
+        "tiled": True, "blockxsize": 128, "blockysize": 128,
+    }
+    with rasterio.open(tif, "w", **profile) as dst:
+        dst.write(data, 1)
+
+    windows = []
+    real_window = raster.Window
+
+    def recording_window(*args):
+        windows.append(args)
+        return real_window(*args)
+
+    monkeypatch.setattr(raster, "Window", recording_window)
+
+    # opposite corners: the bounding box spans the whole raster
+    df = pd.DataFrame({"lon": [0.5, 1023.5], "lat": [1023.5, 0.5]})
+    vals, _ = raster.sample_raster(df, tif)
+
+    assert vals.tolist() == [0.0, float(1024 * 1024 - 1)]
+    assert len(windows) == 2
+    assert all(w * h <= 128 * 128 for _, _, w, h in windows)
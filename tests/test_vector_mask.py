@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 import pandas as pd
@@ -26,4 +27,129 @@ def test_filter_by_polygon_geojson(tmp_path: Path):
     out, summary = filter_by_polygon(df, mask_path, lon="lon", lat="lat", predicate="within")
     assert out["name"].tolist() == ["inside"]
     assert summary.N_total == 2
-    assert summary.N_pass == 1
\ No newline at end of file
+    assert summary.N_pass == 1
+
+
+def test_filter_by_polygon_reprojects_points(tmp_path: Path):
+    try:
+        import geopandas as gpd
+        from shapely.geometry import Polygon
+    except Exception:
+        pytest.skip("geopandas/shapely not installed")
+
+    # same AOI stored in Web Mercator; points stay lon/lat
+    poly = Polygon([(0, 0), (2, 0), (2, 2), (0, 2)])
+    gdf = gpd.GeoDataFrame({"id": [1]}, geometry=[poly], crs="EPSG:4326").to_crs("EPSG:3857")
+    mask_path = tmp_path / "mask.gpkg"
+    gdf.to_file(mask_path)
+
+    df = pd.DataFrame({"lon": [1.0, 3.0, None], "lat": [1.0, 1.0, 1.0], "name": ["inside", "outside", "nan"]})
+
+    out, _ = filter_by_polygon(df, mask_path, predicate="intersects")
+    assert out["name"].tolist() == ["inside"]
+    out, _ = filter_by_polygon(df, mask_path, invert=True)
+    assert out["name"].tolist() == ["outside", "nan"]
+
+
+def test_filter_by_polygon_many_features_strtree(tmp_path: Path, monkeypatch):
+    try:
+        import geopandas as gpd
+        import numpy as np
+        from shapely.geometry import box
+    except Exception:
+        pytest.skip("geopandas/shapely not installed")
+
+    from atl08kit import vector_mask
+
+    # 4x4 grid of separate 0.5-degree squares -> STRtree path
+    cells = [box(i, j, i + 0.5, j + 0.5) for i in range(4) for j in range(4)]
+    mask_path = tmp_path / "grid.gpkg"
+    gpd.GeoDataFrame({"id": range(16)}, geometry=cells, crs="EPSG:4326").to_file(mask_path)
+
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"lon": rng.uniform(-0.5, 4.5, 500), "lat": rng.uniform(-0.5, 4.5, 500)})
+
+    for predicate in ("within", "intersects"):
+        vector_mask._load_mask.cache_clear()
+        tree_out, _ = vector_mask.filter_by_polygon(df, mask_path, predicate=predicate)
+        monkeypatch.setattr(vector_mask, "_STRTREE_MIN_FEATURES", 10**9)
+        vector_mask._load_mask.cache_clear()  # loaded masks are cached: force the union path
+        union_out, _ = vector_mask.filter_by_polygon(df, mask_path, predicate=predicate)
+        monkeypatch.undo()
+        vector_mask._load_mask.cache_clear()
+        assert 0 < len(tree_out) < len(df)
+        assert tree_out.index.tolist() == union_out.index.tolist()
+
+
+def test_filter_by_polygon_caches_mask(tmp_path: Path, monkeypatch):
+    try:
+        import geopandas as gpd
+        from shapely.geometry import box
+    except Exception:
+        pytest.skip("geopandas/shapely not installed")
+
+    from atl08kit import vector_mask
+
+    mask_path = tmp_path / "mask.geojson"
+    gpd.GeoDataFrame({"id": [1]}, geometry=[box(0, 0, 2, 2)], crs="EPSG:4326").to_file(mask_path)
+
+    reads = []
+    real_read_file = gpd.read_file
+
+    def counting_read_file(*args, **kwargs):
+        reads.append(args[0])
+        return real_read_file(*args, **kwargs)
+
+    monkeypatch.setattr(vector_mask.gpd, "read_file", counting_read_file)
+    vector_mask._load_mask.cache_clear()
+
+    df = pd.DataFrame({"lon": [1.0, 3.0], "lat": [1.0, 1.0]})
+    for _ in range(3):
+        out, _ = filter_by_polygon(df, mask_path)
+        assert out["lon"].tolist() == [1.0]
+    assert len(reads) == 1
+
+    # rewritten mask (new mtime) is read again
+    gpd.GeoDataFrame({"id": [1]}, geometry=[box(2, 0, 4, 2)], crs="EPSG:4326").to_file(mask_path)
+    st = mask_path.stat()
+    os.utime(mask_path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    out, _ = filter_by_polygon(df, mask_path)
+    assert out["lon"].tolist() == [3.0]
+    assert len(reads) == 2
+    vector_mask._load_mask.cache_clear()
+
+
+def test_filter_by_polygon_boundary_points_same_on_both_paths(tmp_path: Path, monkeypatch):
+    try:
+        import geopandas as gpd
+        from shapely.geometry import box
+    except Exception:
+        pytest.skip("geopandas/shapely not installed")
+
+    from atl08kit import vector_mask
+
+    # 10 adjacent unit squares along x (> _STRTREE_MIN_FEATURES -> STRtree path)
+    cells = [box(i, 0, i + 1, 1) for i in range(10)]
+    mask_path = tmp_path / "strip.gpkg"
+    gpd.GeoDataFrame({"id": range(10)}, geometry=cells, crs="EPSG:4326").to_file(mask_path)
+
+    df = pd.DataFrame(
+        {
+            # shared border, outer edge, top edge, vertex on top edge, interior, outside
+            "lon": [1.0, 0.0, 0.5, 5.0, 0.5, 11.0],
+            "lat": [0.5, 0.5, 1.0, 1.0, 0.5, 0.5],
+        }
+    )
+    expected = {
+        "within": [True, False, False, False, True, False],
+        "intersects": [True, True, True, True, True, False],
+    }
+    for predicate, keep in expected.items():
+        vector_mask._load_mask.cache_clear()
+        tree_out, _ = vector_mask.filter_by_polygon(df, mask_path, predicate=predicate)
+        monkeypatch.setattr(vector_mask, "_STRTREE_MIN_FEATURES", 10**9)
+        vector_mask._load_mask.cache_clear()
+        union_out, _ = vector_mask.filter_by_polygon(df, mask_path, predicate=predicate)
+        monkeypatch.undo()
+        vector_mask._load_mask.cache_clear()
+        assert tree_out.index.tolist() == union_out.index.tolist() == df.index[keep].tolist(), predicate